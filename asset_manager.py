@@ -0,0 +1,173 @@
+import os
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from utils import external_path
+
+AUDIO_EXTENSIONS = (".mp3", ".wav")
+ROOT = ""                     # 程式根目錄 (舊版音效位置)
+ASSET_FOLDERS = (ROOT, "SOUND", "PIC")
+RESCAN_DELAY_MS = 200         # 合併短時間內的多個檔案事件 (複製檔案時會連續觸發)
+
+
+def file_signature(path):
+    """(修改時間, 大小)，檔案不存在時為 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ImageLoadSignals(QObject):
+    loaded = Signal(str, QImage, object)
+
+
+class ImageLoadTask(QRunnable):
+    """於執行緒池讀取圖片 (QImage 可在非 GUI 執行緒使用)"""
+
+    def __init__(self, path, signature, signals):
+        super().__init__()
+        self.path = path
+        self.signature = signature
+        self.signals = signals
+
+    def run(self):
+        image = QImage(self.path)
+        try:
+            self.signals.loaded.emit(self.path, image, self.signature)
+        except RuntimeError:
+            # 載入期間轉盤視窗已關閉
+            pass
+
+
+class AssetManager(QObject):
+    """SOUND/ 與 PIC/ 資產索引
+
+    啟動時掃描一次並以 QFileSystemWatcher 維持最新，查詢不需逐一探測檔案；
+    圖片於背景執行緒載入，完成後才替換，載入期間繼續使用舊圖片。
+    """
+    assets_changed = Signal(str, list)  # 資料夾, 新增/修改/刪除的檔名
+    image_loaded = Signal(str, QImage)  # 路徑, 圖片 (失敗時為空)
+
+    def __init__(self, parent=None, watch=True):
+        super().__init__(parent)
+        self.index = {}            # 資料夾 -> {小寫檔名: (檔名, 簽章)}
+        self.images = {}           # 路徑 -> (簽章, QImage)
+        self.loading = {}          # 路徑 -> 簽章
+        self.pending_folders = set()
+
+        self.image_signals = ImageLoadSignals(self)
+        self.image_signals.loaded.connect(self.on_image_loaded)
+
+        # 離線錄製 (watch=False) 不需要監看檔案
+        self.watcher = QFileSystemWatcher(self) if watch else None
+        if self.watcher is not None:
+            self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.rescan_timer = QTimer(self)
+        self.rescan_timer.setSingleShot(True)
+        self.rescan_timer.setInterval(RESCAN_DELAY_MS)
+        self.rescan_timer.timeout.connect(self.rescan_pending)
+
+        for folder in ASSET_FOLDERS:
+            self.scan(folder)
+
+    # --- 索引 ---
+    def scan(self, folder):
+        """掃描資料夾，回傳有變動的檔名"""
+        directory = external_path(folder)
+        entries = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if folder == ROOT and not entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                        continue
+                    if entry.is_file():
+                        st = entry.stat()
+                        entries[entry.name.lower()] = (entry.name, (st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+        else:
+            if self.watcher is not None and os.path.normpath(directory) not in map(os.path.normpath, self.watcher.directories()):
+                self.watcher.addPath(directory)
+
+        old = self.index.get(folder, {})
+        self.index[folder] = entries
+        changed = [entries[k][0] if k in entries else old[k][0]
+                   for k in set(old) | set(entries) if old.get(k) != entries.get(k)]
+        return changed
+
+    def on_directory_changed(self, directory):
+        directory = os.path.normpath(directory)
+        for folder in ASSET_FOLDERS:
+            if os.path.normpath(external_path(folder)) == directory:
+                self.pending_folders.add(folder)
+        self.rescan_timer.start()
+
+    def rescan_pending(self):
+        folders, self.pending_folders = self.pending_folders, set()
+        if ROOT in folders:
+            # 根目錄變動時 SOUND/ 或 PIC/ 可能剛被建立
+            folders.update(f for f in ASSET_FOLDERS if f != ROOT and f not in self.watched_folders())
+        for folder in folders:
+            changed = self.scan(folder)
+            if changed:
+                self.assets_changed.emit(folder, changed)
+
+    def refresh(self, folder):
+        """立即重新掃描 (自行寫入檔案後呼叫，不等待檔案監看事件)"""
+        changed = self.scan(folder)
+        if changed:
+            self.assets_changed.emit(folder, changed)
+
+    def watched_folders(self):
+        if self.watcher is None:
+            return set()
+        watched = set(map(os.path.normpath, self.watcher.directories()))
+        return {f for f in ASSET_FOLDERS if os.path.normpath(external_path(f)) in watched}
+
+    def path(self, folder, name):
+        """索引中的檔案路徑，不存在時為 None"""
+        entry = self.index.get(folder, {}).get(name.lower())
+        return external_path(os.path.join(folder, entry[0])) if entry else None
+
+    def find_audio(self, basename):
+        """搜尋音效檔案 (優先 SOUND 資料夾, 其次根目錄; 優先 mp3, 其次 wav)"""
+        for folder in ("SOUND", ROOT):
+            for ext in AUDIO_EXTENSIONS:
+                path = self.path(folder, basename + ext)
+                if path:
+                    return path
+        return None
+
+    # --- 圖片 ---
+    def request_image(self, path):
+        """取得圖片：已載入且檔案未變更時直接回傳，否則於背景載入並回傳 None (完成後發出 image_loaded)"""
+        signature = file_signature(path)
+        cached = self.images.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        if signature is None:
+            self.images.pop(path, None)
+            self.image_loaded.emit(path, QImage())
+            return None
+        if self.loading.get(path) != signature:
+            self.loading[path] = signature
+            QThreadPool.globalInstance().start(ImageLoadTask(path, signature, self.image_signals))
+        return None
+
+    def on_image_loaded(self, path, image, signature):
+        if self.loading.get(path) != signature:
+            # 載入期間檔案又被更換，等待較新的結果
+            return
+        del self.loading[path]
+        if not image.isNull():
+            self.images[path] = (signature, image)
+        self.image_loaded.emit(path, image)
+
+    def wait(self):
+        """等待背景載入完成並送出結果 (離線錄製用)"""
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
@@ -0,0 +1,81 @@
+import hashlib
+import os
+import shutil
+from collections import OrderedDict
+
+from utils import external_path
+
+CHUNK_SIZE = 1024 * 1024 # 分段讀取雜湊，不需整個檔案載入記憶體
+DIGEST_CHARS = 32        # 檔名使用的雜湊長度 (128 bits)
+DIGEST_CACHE_SIZE = 64   # 最多記住的檔案雜湊數量
+
+# (絕對路徑, 修改時間, 大小) -> 雜湊 (LRU)；同一來源重複匯入時不需重新讀檔
+_digest_cache = OrderedDict()
+
+
+def file_digest(path):
+    """檔案內容的 SHA-256 (分段讀取)"""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    digest = _digest_cache.get(key)
+    if digest is not None:
+        _digest_cache.move_to_end(key)
+        return digest
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    digest = h.hexdigest()
+    _digest_cache[key] = digest
+    while len(_digest_cache) > DIGEST_CACHE_SIZE:
+        _digest_cache.popitem(last=False)
+    return digest
+
+
+def same_content(path_a, path_b):
+    if os.path.getsize(path_a) != os.path.getsize(path_b):
+        return False
+    return file_digest(path_a) == file_digest(path_b)
+
+
+def copy_atomic(src_path, target_path):
+    """複製到暫存檔後再 rename，播放中的讀取不會讀到一半的檔案"""
+    tmp_path = f"{target_path}.tmp"
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, target_path)
+    except:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def store_file(src_path, folder):
+    """以內容雜湊為檔名存入 folder (SOUND/PIC)
+
+    相同內容只保存一份，已存在時不複製。回傳 (檔名, 是否有複製)。
+    """
+    name = file_digest(src_path)[:DIGEST_CHARS] + os.path.splitext(src_path)[1].lower()
+    directory = external_path(folder)
+    os.makedirs(directory, exist_ok=True)
+    target_path = os.path.join(directory, name)
+    if os.path.exists(target_path) and os.path.getsize(target_path) == os.path.getsize(src_path):
+        return name, False
+    copy_atomic(src_path, target_path)
+    return name, True
+
+
+def copy_if_changed(src_path, target_path):
+    """固定檔名的資產 (tick/finish/loop)：內容相同時不複製。回傳是否有複製"""
+    if os.path.exists(target_path):
+        if os.path.abspath(target_path) == os.path.abspath(src_path) or same_content(src_path, target_path):
+            return False
+    copy_atomic(src_path, target_path)
+    return True
+
+
+def sound_exists(sound_file):
+    """選項音效是否存在 (SOUND/ 內的檔名，或舊資料的完整路徑)"""
+    return os.path.exists(external_path(os.path.join("SOUND", sound_file))) or os.path.exists(sound_file)
@@ -0,0 +1,250 @@
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtMultimedia import QAudioDecoder, QAudioFormat, QAudioSink, QMediaDevices
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 為選用套件，缺少時 WheelWindow 改用 QMediaPlayer 播放
+    np = None
+
+SAMPLE_RATE = 48000
+LATENCY_SECONDS = 0.03  # 預先寫入音效裝置的長度 (越短延遲越低，太短會斷音)
+MIX_INTERVAL_MS = 5
+
+
+class AudioMixer(QObject):
+    """軟體混音器
+
+    每個音效只解碼一次並以 PCM 常駐記憶體，所有聲部 (滴答/循環/結束音效)
+    混合後寫入同一個 QAudioSink，每個聲部可個別設定音量與音高 (播放速率)。
+    """
+    clip_failed = Signal(str, str)
+
+    @staticmethod
+    def available():
+        return np is not None and not QMediaDevices.defaultAudioOutput().isNull()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clips = {}          # 名稱 -> float32 (frames, 2)
+        self.decoders = {}       # 名稱 -> (QAudioDecoder, 已解碼的片段)
+        self.pending_plays = {}  # 名稱 -> 解碼完成後要播放的參數
+        self.voices = []
+
+        device = QMediaDevices.defaultAudioOutput()
+        fmt = QAudioFormat()
+        fmt.setSampleRate(SAMPLE_RATE)
+        fmt.setChannelCount(2)
+        fmt.setSampleFormat(QAudioFormat.Int16)
+        if not device.isFormatSupported(fmt):
+            fmt = device.preferredFormat()
+        self.format = fmt
+        self.sink = QAudioSink(device, fmt, self)
+        self.sink.setBufferSize(fmt.bytesForDuration(int(LATENCY_SECONDS * 2 * 1000000)))
+        self.output = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(MIX_INTERVAL_MS)
+        self.timer.timeout.connect(self.mix)
+
+    # --- 解碼 ---
+    def load(self, name, path):
+        """解碼音效檔 (非同步)，完成後一次替換；path 為空時移除"""
+        old = self.decoders.pop(name, None)
+        if old:
+            old[0].stop()
+            old[0].deleteLater()
+        if not path:
+            self.clips.pop(name, None)
+            return
+
+        decoder = QAudioDecoder(self)
+        # 盡量讓解碼器直接輸出混音格式，不支援時於 to_stereo 轉換
+        decode_format = QAudioFormat()
+        decode_format.setSampleRate(self.format.sampleRate())
+        decode_format.setChannelCount(2)
+        decode_format.setSampleFormat(QAudioFormat.Float)
+        decoder.setAudioFormat(decode_format)
+        decoder.setSource(QUrl.fromLocalFile(path))
+        chunks = []
+        self.decoders[name] = (decoder, chunks)
+        decoder.bufferReady.connect(lambda: chunks.append(self.to_stereo(decoder.read())))
+        decoder.finished.connect(lambda: self.on_decode_finished(name, decoder))
+        decoder.isDecodingChanged.connect(lambda decoding: self.on_decoding_changed(name, decoder, decoding))
+        decoder.start()
+
+    def on_decode_finished(self, name, decoder):
+        entry = self.decoders.get(name)
+        if entry is None or entry[0] is not decoder:
+            return
+        del self.decoders[name]
+        chunks = [c for c in entry[1] if len(c[0])]
+        if chunks:
+            clip = self.resample(np.concatenate([c[0] for c in chunks]), chunks[0][1])
+        else:
+            clip = np.zeros((0, 2), np.float32)
+        self.clips[name] = clip
+        decoder.deleteLater()
+        params = self.pending_plays.pop(name, None)
+        if params is not None:
+            self.play(name, **params)
+
+    def on_decoding_changed(self, name, decoder, decoding):
+        if decoding or decoder.error() == QAudioDecoder.NoError:
+            return
+        entry = self.decoders.get(name)
+        if entry is None or entry[0] is not decoder:
+            return
+        del self.decoders[name]
+        self.pending_plays.pop(name, None)
+        self.clip_failed.emit(name, decoder.errorString())
+        decoder.deleteLater()
+
+    def to_stereo(self, buffer):
+        """QAudioBuffer -> (float32 (frames, 2), 取樣率)，必要時轉換格式與聲道"""
+        fmt = buffer.format()
+        raw = bytes(buffer.constData())[:buffer.byteCount()]
+        sample_format = fmt.sampleFormat()
+        if sample_format == QAudioFormat.Float:
+            samples = np.frombuffer(raw, np.float32)
+        elif sample_format == QAudioFormat.Int16:
+            samples = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+        elif sample_format == QAudioFormat.Int32:
+            samples = np.frombuffer(raw, np.int32).astype(np.float32) / 2147483648.0
+        else:
+            samples = (np.frombuffer(raw, np.uint8).astype(np.float32) - 128.0) / 128.0
+
+        channels = max(1, fmt.channelCount())
+        samples = samples[:len(samples) // channels * channels].reshape(-1, channels)
+        if channels == 1:
+            samples = np.repeat(samples, 2, axis=1)
+        elif channels > 2:
+            samples = samples[:, :2]
+
+        return samples, fmt.sampleRate()
+
+    def resample(self, samples, rate):
+        """轉換為輸出取樣率 (線性內插)"""
+        target = self.format.sampleRate()
+        if rate > 0 and rate != target and len(samples) > 1:
+            count = int(len(samples) * target / rate)
+            x = np.linspace(0, len(samples) - 1, count)
+            samples = np.stack([np.interp(x, np.arange(len(samples)), samples[:, c]) for c in (0, 1)], axis=1)
+        return np.ascontiguousarray(samples, dtype=np.float32)
+
+    # --- 播放 ---
+    def play(self, name, gain=1.0, pitch=1.0, loop=False, tag=None, max_voices=0):
+        """播放已解碼的音效；尚在解碼時於完成後播放。回傳是否有此音效"""
+        clip = self.clips.get(name)
+        if clip is None:
+            if name in self.decoders:
+                self.pending_plays[name] = {'gain': gain, 'pitch': pitch, 'loop': loop,
+                                            'tag': tag, 'max_voices': max_voices}
+                return True
+            return False
+        if not len(clip):
+            return True
+        tag = tag or name
+        if max_voices:
+            # 同類聲部過多時捨棄最舊的
+            same = [id(v) for v in self.voices if v['tag'] == tag]
+            drop = set(same[:max(0, len(same) - max_voices + 1)])
+            self.voices = [v for v in self.voices if id(v) not in drop]
+        self.voices.append({'clip': clip, 'pos': 0.0, 'gain': gain, 'rate': pitch, 'loop': loop, 'tag': tag})
+        if self.output is None:
+            self.output = self.sink.start()
+        if not self.timer.isActive():
+            self.timer.start()
+        self.mix()
+        return True
+
+    def stop(self, tag):
+        self.voices = [v for v in self.voices if v['tag'] != tag]
+        self.pending_plays = {name: params for name, params in self.pending_plays.items()
+                              if (params['tag'] or name) != tag}
+
+    def stop_all(self):
+        self.voices = []
+        self.pending_plays.clear()
+
+    def is_playing(self, tag):
+        return any(v['tag'] == tag for v in self.voices)
+
+    def mix(self):
+        """補滿到目標延遲長度"""
+        if self.output is None:
+            return
+        if not self.voices:
+            # 沒有聲部時停止混音，裝置播完剩餘資料後閒置
+            self.timer.stop()
+            return
+        bytes_per_frame = self.format.bytesPerFrame()
+        queued = (self.sink.bufferSize() - self.sink.bytesFree()) // bytes_per_frame
+        target = self.format.framesForDuration(int(LATENCY_SECONDS * 1000000))
+        frames = min(target - queued, self.sink.bytesFree() // bytes_per_frame)
+        if frames <= 0:
+            return
+        out = np.zeros((frames, 2), np.float32)
+        self.voices = [v for v in self.voices if self.render_voice(v, out)]
+        np.clip(out, -1.0, 1.0, out=out)
+        self.output.write(self.encode(out))
+
+    @staticmethod
+    def render_voice(voice, out):
+        """將一個聲部混入 out，回傳是否還要繼續播放"""
+        clip = voice['clip']
+        length = len(clip)
+        n = len(out)
+        pos = voice['pos']
+        rate = voice['rate']
+        gain = voice['gain']
+        if rate == 1.0:
+            start = int(pos)
+            if voice['loop']:
+                out += clip[(start + np.arange(n)) % length] * gain
+                voice['pos'] = (start + n) % length
+                return True
+            chunk = clip[start:start + n]
+            out[:len(chunk)] += chunk * gain
+            voice['pos'] = pos + n
+            return voice['pos'] < length
+
+        # 改變音高：以播放速率重新取樣 (線性內插)
+        positions = pos + np.arange(n) * rate
+        if voice['loop']:
+            positions %= length
+        else:
+            positions = positions[positions < length - 1]
+        index = positions.astype(np.intp)
+        frac = (positions - index)[:, None]
+        following = (index + 1) % length
+        out[:len(index)] += (clip[index] * (1.0 - frac) + clip[following] * frac) * gain
+        voice['pos'] = pos + n * rate
+        if voice['loop']:
+            voice['pos'] %= length
+            return True
+        return voice['pos'] < length - 1
+
+    def encode(self, out):
+        """float32 立體聲 -> 裝置格式"""
+        channels = self.format.channelCount()
+        if channels == 1:
+            out = out.mean(axis=1, keepdims=True)
+        elif channels > 2:
+            out = np.hstack([out, np.zeros((len(out), channels - 2), np.float32)])
+        sample_format = self.format.sampleFormat()
+        if sample_format == QAudioFormat.Float:
+            return out.astype(np.float32).tobytes()
+        if sample_format == QAudioFormat.Int32:
+            return (out * 2147483647.0).astype(np.int32).tobytes()
+        if sample_format == QAudioFormat.UInt8:
+            return (out * 127.0 + 128.0).astype(np.uint8).tobytes()
+        return (out * 32767.0).astype(np.int16).tobytes()
+
+    def close(self):
+        self.stop_all()
+        self.timer.stop()
+        for decoder, _ in self.decoders.values():
+            decoder.stop()
+        self.decoders.clear()
+        self.sink.stop()
+        self.output = None
@@ -0,0 +1,150 @@
+import colorsys
+import csv
+import io
+import math
+import os
+import random
+
+from PySide6.QtCore import QThread, Signal
+from PySide6.QtGui import QColor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 為選用套件，缺少時逐筆計算顏色
+    np = None
+
+MIN_WEIGHT = 0.1
+MAX_WEIGHT = 10000.0
+HEADER_NAMES = {"name", "名稱", "選項", "項目"}
+GOLDEN_RATIO = 0.618033988749895
+
+
+def read_text_file(path):
+    """讀取文字檔 (UTF-8 優先，失敗時改用繁中 Windows 編碼)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    for encoding in ('utf-8-sig', 'cp950'):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode('utf-8', errors='replace')
+
+
+def parse_weight(value):
+    """解析權重並限制在範圍內，無法解析時拋出 ValueError"""
+    weight = float(value)
+    if not math.isfinite(weight):
+        raise ValueError(f"無效的權重: {value}")
+    return min(max(weight, MIN_WEIGHT), MAX_WEIGHT)
+
+
+def delimiter_for_path(path):
+    """依副檔名決定格式：.csv 以逗號、.tsv 以 Tab 分隔，其餘每行一個名稱"""
+    ext = os.path.splitext(path)[1].lower()
+    return {'.csv': ',', '.tsv': '\t'}.get(ext)
+
+
+def split_rows(text, delimiter=None):
+    """delimiter 為 None 時每行一個名稱 (名稱可含逗號)，否則以 CSV 解析"""
+    if delimiter is None:
+        return ([line] for line in text.splitlines())
+    return csv.reader(io.StringIO(text), delimiter=delimiter)
+
+
+def parse_entries(text, existing_names=(), delimiter=None):
+    """解析 名稱[,權重[,顏色]]，以 dict 做雜湊索引去除重複
+
+    回傳 (entries, skipped, rejected)：entries 為 (名稱, 權重, 顏色字串或 None)，
+    rejected 為權重無法解析而未匯入的 (行號, 權重文字)。
+    """
+    seen = set(existing_names)
+    entries = []
+    skipped = 0
+    rejected = []
+    first = True
+    for line_no, row in enumerate(split_rows(text, delimiter), 1):
+        if not row:
+            continue
+        name = row[0].strip()
+        if first:
+            first = False
+            if name.lower() in HEADER_NAMES:
+                continue
+        if not name:
+            continue
+        weight_text = row[1].strip() if len(row) > 1 else ""
+        try:
+            weight = parse_weight(weight_text) if weight_text else 1.0
+        except ValueError:
+            rejected.append((line_no, weight_text))
+            continue
+        if name in seen:
+            skipped += 1
+            continue
+        seen.add(name)
+        color = row[2].strip() if len(row) > 2 and row[2].strip() else None
+        entries.append((name, weight, color))
+    return entries, skipped, rejected
+
+
+def generate_colors(count, saturation=0.65, value=0.92):
+    """以黃金比例分散色相，一次產生 count 個顏色 (#rrggbb)"""
+    start = random.random()
+    if np is None:
+        colors = []
+        for i in range(count):
+            r, g, b = colorsys.hsv_to_rgb((start + i * GOLDEN_RATIO) % 1.0, saturation, value)
+            colors.append(f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}")
+        return colors
+
+    # 向量化 HSV -> RGB
+    h = (start + np.arange(count) * GOLDEN_RATIO) % 1.0 * 6.0
+    sector = h.astype(np.intp) % 6
+    f = h - np.floor(h)
+    v = np.full(count, value)
+    p = np.full(count, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    rgb = (np.stack([r, g, b], axis=1) * 255).astype(np.int64)
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    return [f"#{c:06x}" for c in packed.tolist()]
+
+
+def build_items(entries):
+    """轉為 ConfigWindow.items 格式，未指定或無效的顏色自動配色"""
+    colors = generate_colors(sum(1 for e in entries if e[2] is None))
+    auto = iter(colors)
+    items = []
+    for name, weight, color_name in entries:
+        color = QColor(color_name) if color_name else None
+        if color is None or not color.isValid():
+            color = QColor(next(auto) if color_name is None else generate_colors(1)[0])
+        items.append({'name': name, 'weight': weight, 'color': color, 'enabled': True})
+    return items
+
+
+class BulkImportWorker(QThread):
+    """於背景執行緒讀檔、解析與去重"""
+    parsed = Signal(list, int, list)
+    failed = Signal(str)
+
+    def __init__(self, existing_names, text=None, path=None, delimiter=None, parent=None):
+        super().__init__(parent)
+        self.existing_names = existing_names
+        self.text = text
+        self.path = path
+        self.delimiter = delimiter
+
+    def run(self):
+        try:
+            text = read_text_file(self.path) if self.path else (self.text or "")
+            entries, skipped, rejected = parse_entries(text, self.existing_names, self.delimiter)
+            items = build_items(entries)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.parsed.emit(items, skipped, rejected)
@@ -3,22 +3,29 @@ import json
 import os
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, 
-    QListWidget, QListWidgetItem, QColorDialog, QCheckBox, 
+    QColorDialog, QCheckBox, 
     QMessageBox, QDoubleSpinBox, QLabel, QGroupBox, QFormLayout,
     QInputDialog, QSlider, QFileDialog, QRadioButton, QButtonGroup,
-    QSpinBox, QComboBox, QDialog
+    QComboBox, QDialog, QListView, QApplication
 )
-from PySide6.QtGui import QColor, QFont, QPainter, QBrush, QPen, QCursor
+from PySide6.QtGui import QColor
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PySide6.QtCore import Qt, QTimer, Signal, QRectF, QSize, QUrl
-from collections import Counter
+from PySide6.QtCore import Qt, QTimer, QUrl
 from wheel_window import WheelWindow
 from utils import resource_path, external_path
 from calibration_dialog import ImageCalibrationDialog
-import csv
-import shutil
+from persistence import WriteBehindWriter, atomic_write_json
+from history_journal import HistoryJournal, new_session
+from history_model import HistoryModel
+from item_list_model import ItemListModel, ItemDelegate
+from bulk_import import BulkImportWorker, delimiter_for_path
+from history_export import HistoryExportWorker, FORMAT_WIDE, FORMAT_LONG
+from spin_recorder import SpinRecordProcess, build_job, needs_ffmpeg, find_ffmpeg
+from asset_store import store_file, copy_if_changed, sound_exists
+import time
 
 SETTINGS_FILE = external_path("settings.json")
+HISTORY_FILE = external_path("history.jsonl")
 
 
 class SoundConflictDialog(QDialog):
@@ -149,89 +156,6 @@ class CollapsibleBox(QWidget):
     def setContentLayout(self, layout):
         self.content_layout.addLayout(layout)
 
-class ItemWidget(QWidget):
-    """選項列表項目元件"""
-    toggled = Signal(bool)
-    sound_toggled = Signal(bool)
-    import_clicked = Signal()
-    
-    def __init__(self, name, weight, color, prob, enabled, sound_enabled, sound_file=""):
-        super().__init__()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(10, 8, 10, 8)
-        
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(enabled)
-        self.checkbox.toggled.connect(self.on_toggled)
-        self.checkbox.setStyleSheet("QCheckBox::indicator { width: 20px; height: 20px; }")
-        layout.addWidget(self.checkbox)
-        
-        self.color_lbl = QLabel()
-        self.color_lbl.setFixedSize(20, 20)
-        self.color_lbl.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #555;")
-        layout.addWidget(self.color_lbl)
-        
-        text = f"{name} (W: {weight:.1f} | P: {prob:.1f}%)"
-        self.info_lbl = QLabel(text)
-        self.info_lbl.setStyleSheet("font-size: 10pt; font-weight: bold;")
-        layout.addWidget(self.info_lbl)
-        
-        layout.addStretch()
-        
-        # 音效設定
-        self.sound_check = QCheckBox("音效")
-        self.sound_check.setChecked(sound_enabled)
-        self.sound_check.toggled.connect(self.on_sound_toggled)
-        layout.addWidget(self.sound_check)
-        
-        self.import_btn = QPushButton("匯入音效")
-        
-        if sound_file:
-            self.import_btn.setText(f"♪ {sound_file}")
-            self.import_btn.setToolTip(f"目前音效: {sound_file}")
-            self.import_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
-            self.import_btn.setFixedWidth(120) # Widen for text
-        else:
-            self.import_btn.setFixedSize(70, 25)
-            self.import_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-            """)
-            
-        self.import_btn.clicked.connect(self.import_clicked.emit)
-        layout.addWidget(self.import_btn)
-        
-        self.setLayout(layout)
-        
-    def on_toggled(self, checked):
-        """核取方塊切換事件"""
-        self.toggled.emit(checked)
-
-    def on_sound_toggled(self, checked):
-        """音效切換事件"""
-        self.sound_toggled.emit(checked)
-
 class ConfigWindow(QWidget):
     """設定視窗主類別"""
     def __init__(self):
@@ -283,12 +207,12 @@ class ConfigWindow(QWidget):
                 border: 1px solid #ccc;
                 border-radius: 4px;
             }
-            QListWidget {
+            QListView {
                 border: 1px solid #ddd;
                 border-radius: 4px;
                 background-color: #f9f9f9;
             }
-            QListWidget::item {
+            QListView::item {
                 border-bottom: 1px solid #eee;
                 padding: 0px; 
             }
@@ -299,8 +223,14 @@ class ConfigWindow(QWidget):
         self.test_window = None
         self.current_file_path = None # Track current file
         
-        self.history_sessions = [{"data": [], "memo": ""}]
+        # 未載入的場次為 None，需要時才從日誌讀取 (見 history_session)
+        self.history_sessions = [new_session()]
         self.curr_session_idx = 0
+        self.history_journal = HistoryJournal(HISTORY_FILE)
+        self.memo_dirty_session = None # 備註已修改但尚未寫入日誌的場次
+        self.export_worker = None
+        self.bulk_import_worker = None
+        self.record_process = None
         self.history_grouped = True
         self.panel_expanded = False
         self.history_panel_width = 300
@@ -309,6 +239,9 @@ class ConfigWindow(QWidget):
         self.is_auto_spinning = False
         self.auto_spin_speed = 3.0
         
+        self.active_rows = [] # 轉盤上第 i 個選項對應 self.items 的列
+        self.removed_rows_pending = []
+        
         self.result_text_color = QColor(255, 255, 255)
         self.result_bg_color = QColor(0, 0, 0)
         self.border_enabled = True
@@ -324,6 +257,7 @@ class ConfigWindow(QWidget):
         self.wheel_mode = "classic" # "classic" 或 "image"
         self.wheel_mode = "classic" # "classic" 或 "image"
         self.pointer_image_path = resource_path(os.path.join("PIC", "ARR.png"))
+        self.pointer_image_name = "" # 匯入時的原始檔名 (PIC/ 內以內容雜湊命名)
         self.pointer_angle_offset = 135
         self.pointer_scale = 0.4
         self.spin_speed_multiplier = 1.0 # 速度倍率 (1.0 = 正常)
@@ -333,6 +267,10 @@ class ConfigWindow(QWidget):
         self.show_pointer_line = True
         self.editing_index = -1
         
+        # settings.json / autosave.json 延遲合併寫入 (背景執行緒、原子取代)
+        self.settings_writer = WriteBehindWriter(self.settings_snapshot, parent=self)
+        self.items_writer = WriteBehindWriter(self.items_snapshot, parent=self)
+        
         self.init_ui()
         self.load_last_settings()
         
@@ -376,6 +314,11 @@ class ConfigWindow(QWidget):
         self.cancel_edit_btn.setStyleSheet("background-color: #9E9E9E;")
         input_layout.addRow(self.cancel_edit_btn)
         
+        self.bulk_import_btn = QPushButton("批次匯入 (CSV/TXT/剪貼簿)")
+        self.bulk_import_btn.setStyleSheet("background-color: #009688;")
+        self.bulk_import_btn.clicked.connect(self.show_bulk_import_dialog)
+        input_layout.addRow(self.bulk_import_btn)
+        
         self.input_group.setContentLayout(input_layout)
         main_layout.addWidget(self.input_group)
 
@@ -590,6 +533,19 @@ class ConfigWindow(QWidget):
         
         speed_layout.addStretch()
         
+        self.remove_winner_check = QCheckBox("抽中移除")
+        self.remove_winner_check.setToolTip("抽中的選項在本次場次中移出轉盤 (不放回抽選)")
+        self.remove_winner_check.stateChanged.connect(self.update_wheel_settings)
+        speed_layout.addWidget(self.remove_winner_check)
+        
+        self.restore_removed_btn = QPushButton("復原移除")
+        self.restore_removed_btn.setToolTip("將本場次抽中移除的選項放回轉盤")
+        self.restore_removed_btn.clicked.connect(self.restore_removed_items)
+        self.restore_removed_btn.setEnabled(False)
+        speed_layout.addWidget(self.restore_removed_btn)
+        
+        speed_layout.addSpacing(10)
+        
         self.multi_spin_setup_btn = QPushButton("設定連抽")
         self.multi_spin_setup_btn.clicked.connect(self.show_multi_spin_dialog)
         self.multi_spin_setup_btn.setEnabled(False)
@@ -598,6 +554,14 @@ class ConfigWindow(QWidget):
         
         speed_layout.addSpacing(10)
         
+        self.record_btn = QPushButton("錄製")
+        self.record_btn.setToolTip("將上一次轉動輸出為 PNG 序列 / MP4 / GIF / WebP")
+        self.record_btn.clicked.connect(self.record_last_spin)
+        self.record_btn.setEnabled(False)
+        speed_layout.addWidget(self.record_btn)
+        
+        speed_layout.addSpacing(10)
+        
         # Window Mode Combo moved up
         
         style_layout.addRow("旋轉速度:", speed_layout)
@@ -609,11 +573,22 @@ class ConfigWindow(QWidget):
         list_group = QGroupBox("選項列表 (雙擊編輯)")
         list_layout = QVBoxLayout()
         
-        self.item_list = QListWidget()
-        self.item_list.setSelectionMode(QListWidget.SingleSelection)
-        self.item_list.setDragDropMode(QListWidget.InternalMove)
-        self.item_list.itemDoubleClicked.connect(self.load_item_for_edit)
-        self.item_list.model().rowsMoved.connect(self.on_list_reordered)
+        # 選項列表：model/view + delegate 繪製，只有可見的列需要成本
+        self.item_model = ItemListModel(self)
+        self.item_delegate = ItemDelegate(self)
+        self.item_delegate.toggled.connect(self.on_item_toggled)
+        self.item_delegate.sound_toggled.connect(self.on_item_sound_toggled)
+        self.item_delegate.import_clicked.connect(self.on_item_import_clicked)
+        self.item_list = QListView()
+        self.item_list.setModel(self.item_model)
+        self.item_list.setItemDelegate(self.item_delegate)
+        self.item_list.setUniformItemSizes(True)
+        self.item_list.setMouseTracking(True)
+        self.item_list.setSelectionMode(QListView.SingleSelection)
+        self.item_list.setDragDropMode(QListView.InternalMove)
+        self.item_list.setDefaultDropAction(Qt.MoveAction)
+        self.item_list.doubleClicked.connect(self.load_item_for_edit)
+        self.item_model.rowsMoved.connect(self.on_list_reordered)
         list_layout.addWidget(self.item_list)
         
         btn_layout = QHBoxLayout()
@@ -703,15 +678,20 @@ class ConfigWindow(QWidget):
         
         self.history_memo = QLineEdit()
         self.history_memo.setPlaceholderText("備註 (跟隨此紀錄)")
-        self.history_memo.textChanged.connect(self.save_current_memo)
+        self.history_memo.textChanged.connect(self.on_memo_edited)
+        # 逐字輸入只更新記憶體，編輯完成 (Enter/離開焦點) 才寫入日誌
+        self.history_memo.editingFinished.connect(self.save_current_memo)
         hist_layout.addWidget(self.history_memo)
         
         self.hist_view_btn = QPushButton("切換：合併顯示")
         self.hist_view_btn.clicked.connect(self.toggle_history_view)
         hist_layout.addWidget(self.hist_view_btn)
         
-        self.history_list = QListWidget()
-        self.history_list.setSelectionMode(QListWidget.NoSelection) # 禁止選取
+        self.history_model = HistoryModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setSelectionMode(QListView.NoSelection) # 禁止選取
+        self.history_list.setUniformItemSizes(True)
         hist_layout.addWidget(self.history_list)
         
         # Bottom controls for history
@@ -792,19 +772,22 @@ class ConfigWindow(QWidget):
             
     def add_history_record(self, winner_name):
         """新增歷史紀錄"""
-        self.history_sessions[self.curr_session_idx]['data'].append(winner_name)
-        if self.panel_expanded:
-            self.update_history_list()
+        self.append_history_results([winner_name])
             
         if self.is_auto_spinning and self.auto_spin_count > 0:
             self.auto_spin_count -= 1
             if self.auto_spin_count > 0:
                 QTimer.singleShot(500, self.trigger_auto_spin)
             else:
-                self.is_auto_spinning = False
-                self.multi_spin_setup_btn.setText("設定連抽")
-                self.multi_spin_setup_btn.setStyleSheet("background-color: #673AB7;")
-                QMessageBox.information(self, "完成", "多連抽已完成！")
+                self.finish_auto_spin("多連抽已完成！")
+
+    def finish_auto_spin(self, message):
+        """結束動畫連抽並還原按鈕"""
+        self.is_auto_spinning = False
+        self.auto_spin_count = 0
+        self.multi_spin_setup_btn.setText("設定連抽")
+        self.multi_spin_setup_btn.setStyleSheet("background-color: #673AB7;")
+        QMessageBox.information(self, "完成", message)
 
     def show_multi_spin_dialog(self):
         """顯示多連抽設定對話框"""
@@ -828,25 +811,43 @@ class ConfigWindow(QWidget):
         if reply == QMessageBox.Yes:
             self.clear_history()
 
-        # 速度輸入
-        input_dialog_speed = QInputDialog(self)
-        input_dialog_speed.setWindowTitle("多連抽設定")
-        input_dialog_speed.setLabelText("速度倍率 (原本的幾倍?):")
-        input_dialog_speed.setDoubleDecimals(1)
-        input_dialog_speed.setDoubleRange(1.0, 10.0)
-        input_dialog_speed.setDoubleValue(3.0)
-        input_dialog_speed.setWindowFlags(input_dialog_speed.windowFlags() | Qt.WindowStaysOnTopHint)
-        
-        if input_dialog_speed.exec() == QInputDialog.Accepted:
-            speed = input_dialog_speed.doubleValue()
+        # 連抽模式
+        modes = ["動畫連抽", "即時連抽 (無動畫)", "即時連抽 (僅最後一抽動畫)"]
+        input_dialog_mode = QInputDialog(self)
+        input_dialog_mode.setWindowTitle("多連抽設定")
+        input_dialog_mode.setLabelText("連抽模式:")
+        input_dialog_mode.setComboBoxItems(modes)
+        input_dialog_mode.setComboBoxEditable(False)
+        input_dialog_mode.setWindowFlags(input_dialog_mode.windowFlags() | Qt.WindowStaysOnTopHint)
+        
+        if input_dialog_mode.exec() == QInputDialog.Accepted:
+            mode_index = modes.index(input_dialog_mode.textValue())
         else:
             return
+        instant = mode_index > 0
+        animate_last = mode_index == 2
+
+        # 速度輸入 (無動畫模式不需要)
+        speed = self.auto_spin_speed
+        if not instant or animate_last:
+            input_dialog_speed = QInputDialog(self)
+            input_dialog_speed.setWindowTitle("多連抽設定")
+            input_dialog_speed.setLabelText("速度倍率 (原本的幾倍?):")
+            input_dialog_speed.setDoubleDecimals(1)
+            input_dialog_speed.setDoubleRange(1.0, 10.0)
+            input_dialog_speed.setDoubleValue(3.0)
+            input_dialog_speed.setWindowFlags(input_dialog_speed.windowFlags() | Qt.WindowStaysOnTopHint)
+            
+            if input_dialog_speed.exec() == QInputDialog.Accepted:
+                speed = input_dialog_speed.doubleValue()
+            else:
+                return
 
         # 次數輸入
         input_dialog_count = QInputDialog(self)
         input_dialog_count.setWindowTitle("多連抽設定")
         input_dialog_count.setLabelText("連抽次數:")
-        input_dialog_count.setIntRange(1, 1000)
+        input_dialog_count.setIntRange(1, 1000000 if instant else 1000)
         input_dialog_count.setIntValue(10)
         input_dialog_count.setWindowFlags(input_dialog_count.windowFlags() | Qt.WindowStaysOnTopHint)
 
@@ -861,6 +862,11 @@ class ConfigWindow(QWidget):
             self.wheel_window.show()
             self.wheel_window.raise_()
         
+        if instant:
+            if self.wheel_window:
+                self.run_instant_multi_spin(count, speed, animate_last)
+            return
+        
         self.auto_spin_count = count
         self.auto_spin_speed = speed
         self.is_auto_spinning = True
@@ -870,17 +876,57 @@ class ConfigWindow(QWidget):
         
         self.trigger_auto_spin()
         
+    def run_instant_multi_spin(self, count, speed, animate_last):
+        """即時連抽：一次完成所有加權抽選並批次寫入紀錄"""
+        instant_count = count - 1 if animate_last else count
+        winners = self.wheel_window.instant_spin(instant_count)
+        self.append_history_results(winners)
+        
+        if animate_last:
+            # 最後一抽交給一般連抽流程播放動畫，完成時由 add_history_record 收尾
+            self.auto_spin_count = 1
+            self.auto_spin_speed = speed
+            self.is_auto_spinning = True
+            self.multi_spin_setup_btn.setText("停止連抽")
+            self.multi_spin_setup_btn.setStyleSheet("background-color: #d32f2f;")
+            self.trigger_auto_spin()
+        else:
+            QMessageBox.information(self, "完成", f"多連抽已完成！ (共 {len(winners)} 次)")
+
+    def history_session(self, idx):
+        """取得紀錄場次 (未載入時才從日誌讀取)"""
+        session = self.history_sessions[idx]
+        if session is None:
+            session = self.history_journal.load_session(idx)
+            self.history_sessions[idx] = session
+        return session
+
+    def append_history_results(self, names):
+        """新增結果到目前場次，並於日誌追加一行"""
+        if not names:
+            return
+        session = self.history_session(self.curr_session_idx)
+        now = round(time.time(), 3)
+        times = [now] * len(names)
+        session['data'].extend(names)
+        session['times'].extend(times)
+        self.history_journal.append_results(self.curr_session_idx, names, times)
+        self.history_model.results_appended()
+
     def trigger_auto_spin(self):
         """觸發自動旋轉"""
         if self.wheel_window and self.is_auto_spinning:
+            if self.wheel_window.sector_index.total_weight <= 0:
+                # 抽中移除模式下選項已全部抽出，start_spin 不會再發出 spin_finished
+                self.finish_auto_spin("選項已全部抽出，多連抽提前結束。")
+                return
             self.wheel_window.auto_spin(self.auto_spin_speed)
         
     def update_history_list(self):
-        """更新歷史紀錄列表"""
-        self.history_list.clear()
-        
-        current_data = self.history_sessions[self.curr_session_idx]['data']
-        current_memo = self.history_sessions[self.curr_session_idx]['memo']
+        """更新歷史紀錄列表 (切換場次或顯示模式時重設模型)"""
+        self.save_current_memo()
+        current_session = self.history_session(self.curr_session_idx)
+        current_memo = current_session['memo']
         
         # update memo without triggering signal loop if possible, or just set it
         self.history_memo.blockSignals(True)
@@ -889,23 +935,11 @@ class ConfigWindow(QWidget):
         
         self.hist_title_lbl.setText(f"轉動紀錄 ({self.curr_session_idx + 1})")
         self.prev_session_btn.setEnabled(self.curr_session_idx > 0)
+        self.hist_view_btn.setText("切換：個別顯示" if self.history_grouped else "切換：合併顯示")
         
-        if not current_data:
-            return
-        
-        if self.history_grouped:
-            self.hist_view_btn.setText("切換：個別顯示")
-            counts = Counter(current_data)
-            for name, count in counts.most_common():
-                item = QListWidgetItem(f"{name} x{count}")
-                item.setTextAlignment(Qt.AlignCenter)
-                self.history_list.addItem(item)
-        else:
-            self.hist_view_btn.setText("切換：合併顯示")
-            for name in reversed(current_data):
-                item = QListWidgetItem(name)
-                item.setTextAlignment(Qt.AlignCenter)
-                self.history_list.addItem(item)
+        self.history_model.set_grouped(self.history_grouped)
+        if self.history_model.data_list is not current_session['data']:
+            self.history_model.set_session(current_session['data'])
 
     def toggle_history_view(self):
         """切換歷史紀錄顯示模式"""
@@ -914,7 +948,9 @@ class ConfigWindow(QWidget):
         
     def clear_history(self):
         """清空歷史紀錄"""
-        self.history_sessions[self.curr_session_idx]['data'] = []
+        session = self.history_session(self.curr_session_idx)
+        session['data'] = []
+        session['times'] = []
         # user might want to keep the memo, or clear it? 
         # "備註 (清空時移除)" -> implies clear.
         # But now "跟隨此紀錄". Let's clear data but keep memo? 
@@ -922,8 +958,12 @@ class ConfigWindow(QWidget):
         # Usually clearing history clears data. Let's clear data only for now unless user asked to clear memo.
         # Actually previous code cleared memo: self.history_memo.clear()
         # Let's keep that behavior for the current session.
-        self.history_sessions[self.curr_session_idx]['memo'] = ""
+        session['memo'] = ""
+        self.memo_dirty_session = None
+        self.history_journal.clear_session(self.curr_session_idx)
+        self.history_memo.blockSignals(True)
         self.history_memo.clear()
+        self.history_memo.blockSignals(False)
         self.update_history_list()
 
     def prev_session(self):
@@ -936,15 +976,24 @@ class ConfigWindow(QWidget):
         # Check if current session is last
         if self.curr_session_idx == len(self.history_sessions) - 1:
             # Create new session
-            self.history_sessions.append({"data": [], "memo": ""})
+            self.history_sessions.append(new_session())
+            self.history_journal.add_session(len(self.history_sessions) - 1)
             
         self.curr_session_idx += 1
         self.update_history_list()
         self.save_settings()
         
+    def on_memo_edited(self, text):
+        self.history_session(self.curr_session_idx)['memo'] = text
+        self.memo_dirty_session = self.curr_session_idx
+
     def save_current_memo(self):
-        self.history_sessions[self.curr_session_idx]['memo'] = self.history_memo.text()
-        pass
+        """將修改過的備註寫入日誌 (每次編輯只寫一行)"""
+        session_idx = self.memo_dirty_session
+        if session_idx is None:
+            return
+        self.memo_dirty_session = None
+        self.history_journal.set_memo(session_idx, self.history_session(session_idx)['memo'])
 
     def clear_all_history(self):
         """清除所有歷史紀錄"""
@@ -957,13 +1006,28 @@ class ConfigWindow(QWidget):
         msg_box.setWindowModality(Qt.WindowModal)
         
         if msg_box.exec() == QMessageBox.Yes:
-            self.history_sessions = [{"data": [], "memo": ""}]
+            self.history_sessions = [new_session()]
             self.curr_session_idx = 0
+            self.memo_dirty_session = None
+            self.history_journal.clear_all()
             self.update_history_list()
             self.save_settings()
 
     def export_history_csv(self):
-        """匯出所有歷史紀錄為 CSV"""
+        """匯出所有歷史紀錄為 CSV (背景執行緒串流寫入)"""
+        if self.export_worker and self.export_worker.isRunning():
+            return
+        formats = ["每場次一欄 (轉置)", "每筆一列 (場次, 序號, 項目, 時間)"]
+        format_dialog = QInputDialog(self)
+        format_dialog.setWindowTitle("匯出 CSV")
+        format_dialog.setLabelText("匯出格式:")
+        format_dialog.setComboBoxItems(formats)
+        format_dialog.setComboBoxEditable(False)
+        format_dialog.setWindowModality(Qt.WindowModal)
+        if format_dialog.exec() != QInputDialog.Accepted:
+            return
+        fmt = FORMAT_LONG if formats.index(format_dialog.textValue()) == 1 else FORMAT_WIDE
+
         # 使用 WindowModal 檔案對話框
         dialog = QFileDialog(self, "匯出 CSV", "", "CSV Files (*.csv)")
         dialog.setAcceptMode(QFileDialog.AcceptSave)
@@ -972,55 +1036,114 @@ class ConfigWindow(QWidget):
         if dialog.exec():
             files = dialog.selectedFiles()
             if files:
-                file_name = files[0]
-                try:
-                    with open(file_name, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                        writer = csv.writer(csvfile)
-                        
-                        # 準備資料
-                        # Row 1: Session IDs
-                        ids = [f"紀錄 {i+1}" for i in range(len(self.history_sessions))]
-                        writer.writerow(ids)
-                        
-                        # Row 2: Memos
-                        memos = [s.get('memo', '') for s in self.history_sessions]
-                        writer.writerow(memos)
-                        
-                        # Row 3+: Data (Transpose)
-                        # Find max length
-                        max_len = 0
-                        for s in self.history_sessions:
-                            data = s.get('data', [])
-                            if len(data) > max_len:
-                                max_len = len(data)
-                                
-                        for i in range(max_len):
-                            row_data = []
-                            for s in self.history_sessions:
-                                data = s.get('data', [])
-                                # Chronological: Old -> New
-                                rev_data = list(data)
-                                if i < len(rev_data):
-                                    row_data.append(rev_data[i])
-                                else:
-                                    row_data.append("")
-                            writer.writerow(row_data)
-                                    
-                    # 成功提示也需要 WindowModal
-                    msg = QMessageBox(self)
-                    msg.setWindowTitle("成功")
-                    msg.setText("匯出完成！")
-                    msg.setIcon(QMessageBox.Information)
-                    msg.setWindowModality(Qt.WindowModal)
-                    msg.exec()
-                    
-                except Exception as e:
-                    msg = QMessageBox(self)
-                    msg.setWindowTitle("錯誤")
-                    msg.setText(f"匯出失敗: {str(e)}")
-                    msg.setIcon(QMessageBox.Critical)
-                    msg.setWindowModality(Qt.WindowModal)
-                    msg.exec()
+                # 匯出讀取日誌，正在編輯的備註需先寫入
+                self.save_current_memo()
+                self.export_worker = HistoryExportWorker(files[0], self.history_journal, fmt, self)
+                self.export_worker.progress.connect(self.on_export_progress)
+                self.export_worker.succeeded.connect(self.on_export_succeeded)
+                self.export_worker.failed.connect(self.on_export_failed)
+                self.export_csv_btn.setEnabled(False)
+                self.export_worker.start()
+
+    def on_export_progress(self, done, total):
+        percent = done * 100 // total if total else 100
+        self.export_csv_btn.setText(f"匯出中 {percent}%")
+
+    def on_export_finished(self):
+        self.export_csv_btn.setText("匯出 CSV")
+        self.export_csv_btn.setEnabled(True)
+
+    def on_export_succeeded(self, path):
+        self.on_export_finished()
+        # 成功提示也需要 WindowModal
+        msg = QMessageBox(self)
+        msg.setWindowTitle("成功")
+        msg.setText("匯出完成！")
+        msg.setIcon(QMessageBox.Information)
+        msg.setWindowModality(Qt.WindowModal)
+        msg.exec()
+
+    def on_export_failed(self, error):
+        self.on_export_finished()
+        msg = QMessageBox(self)
+        msg.setWindowTitle("錯誤")
+        msg.setText(f"匯出失敗: {error}")
+        msg.setIcon(QMessageBox.Critical)
+        msg.setWindowModality(Qt.WindowModal)
+        msg.exec()
+
+    def record_last_spin(self):
+        """以獨立行程離線重播上一次轉動並輸出影片/動畫"""
+        if not self.wheel_window or self.record_process is not None:
+            return
+        if self.wheel_window.last_spin is None or self.wheel_window.is_spinning:
+            msg = QMessageBox(self)
+            msg.setWindowTitle("錄製")
+            msg.setText("請先轉動一次轉盤，並等待停止後再錄製。")
+            msg.setIcon(QMessageBox.Information)
+            msg.setWindowModality(Qt.WindowModal)
+            msg.exec()
+            return
+
+        dialog = QFileDialog(self, "錄製轉動", "spin.png",
+                             "PNG 序列 (*.png);;MP4 (*.mp4);;GIF (*.gif);;WebP (*.webp)")
+        dialog.setAcceptMode(QFileDialog.AcceptSave)
+        dialog.setWindowModality(Qt.WindowModal)
+        if not dialog.exec() or not dialog.selectedFiles():
+            return
+        path = dialog.selectedFiles()[0]
+        if not os.path.splitext(path)[1]:
+            path += "." + dialog.selectedNameFilter().split("*.")[-1].rstrip(")")
+        if needs_ffmpeg(path) and not find_ffmpeg():
+            msg = QMessageBox(self)
+            msg.setWindowTitle("錯誤")
+            msg.setText("找不到 ffmpeg，無法輸出影片/動畫。\n請安裝 ffmpeg 或將 ffmpeg.exe 放在程式旁，或改用 PNG 序列。")
+            msg.setIcon(QMessageBox.Critical)
+            msg.setWindowModality(Qt.WindowModal)
+            msg.exec()
+            return
+
+        job = build_job(self.wheel_window, self.wheel_settings(), path)
+        self.record_process = SpinRecordProcess(job, self)
+        self.record_process.progress.connect(self.on_record_progress)
+        self.record_process.finished.connect(self.on_record_finished)
+        self.record_btn.setEnabled(False)
+        self.record_btn.setText("錄製中 0%")
+        self.record_process.start()
+
+    def on_record_progress(self, done, total):
+        percent = done * 100 // total if total else 100
+        self.record_btn.setText(f"錄製中 {percent}%")
+
+    def on_record_finished(self, ok, error):
+        self.record_process.deleteLater()
+        self.record_process = None
+        self.record_btn.setText("錄製")
+        self.record_btn.setEnabled(self.wheel_window is not None)
+        msg = QMessageBox(self)
+        if ok:
+            msg.setWindowTitle("成功")
+            msg.setText("錄製完成！")
+            msg.setIcon(QMessageBox.Information)
+        else:
+            msg.setWindowTitle("錯誤")
+            msg.setText(f"錄製失敗: {error}")
+            msg.setIcon(QMessageBox.Critical)
+        msg.setWindowModality(Qt.WindowModal)
+        msg.exec()
+
+    def load_history(self, legacy_sessions=None):
+        """啟動時載入紀錄：只重播目前場次，其餘場次延後載入"""
+        if legacy_sessions and not self.history_journal.exists():
+            # 舊版紀錄存在 settings.json 中，轉入日誌
+            self.history_journal.import_sessions(legacy_sessions)
+        current, count = self.history_journal.load_current(self.curr_session_idx)
+        if self.curr_session_idx >= count:
+            self.curr_session_idx = 0
+            current, count = self.history_journal.load_current(0)
+        self.history_sessions = [None] * max(count, 1)
+        self.history_sessions[self.curr_session_idx] = current
+        self.update_history_list()
 
     def choose_result_color(self):
         """選擇結果文字顏色"""
@@ -1082,22 +1205,108 @@ class ConfigWindow(QWidget):
         if self.editing_index >= 0:
             enabled = self.items[self.editing_index].get('enabled', True)
             self.items[self.editing_index] = {'name': name, 'weight': weight, 'color': color, 'enabled': enabled}
+            self.item_model.weights_changed()
             self.cancel_edit()
         else:
             self.items.append({'name': name, 'weight': weight, 'color': color, 'enabled': enabled})
+            self.item_model.item_appended()
             self.name_input.clear()
             self.name_input.setFocus()
             self.current_color = QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
             self.update_color_btn()
         
-        self.update_list()
         self.update_wheel()
         self.auto_save_items() # Call auto_save_items here
         self.save_settings()
         
-    def load_item_for_edit(self, list_item):
+    def show_bulk_import_dialog(self):
+        """批次匯入選項 (每行: 名稱[,權重[,顏色]])"""
+        if self.bulk_import_worker and self.bulk_import_worker.isRunning():
+            return
+        # 格式由副檔名或使用者選擇決定，不從內容猜測 ("王, 小明" 這類名稱可含逗號)
+        sources = ["從檔案 (.csv 為 名稱,權重,顏色；.txt 為每行一個名稱)",
+                   "從剪貼簿貼上 (每行一個名稱)",
+                   "從剪貼簿貼上 (CSV：名稱,權重,顏色)",
+                   "從剪貼簿貼上 (試算表：Tab 分隔)"]
+        clipboard_delimiters = [None, None, ',', '\t']
+        source_dialog = QInputDialog(self)
+        source_dialog.setWindowTitle("批次匯入")
+        source_dialog.setLabelText("選擇匯入來源與格式：")
+        source_dialog.setComboBoxItems(sources)
+        source_dialog.setComboBoxEditable(False)
+        source_dialog.setWindowModality(Qt.WindowModal)
+        if source_dialog.exec() != QInputDialog.Accepted:
+            return
+
+        text = None
+        path = None
+        source_index = sources.index(source_dialog.textValue())
+        if source_index == 0:
+            dialog = QFileDialog(self, "批次匯入", "", "Text Files (*.csv *.tsv *.txt);;All Files (*)")
+            dialog.setWindowModality(Qt.WindowModal)
+            if not dialog.exec() or not dialog.selectedFiles():
+                return
+            path = dialog.selectedFiles()[0]
+            delimiter = delimiter_for_path(path)
+        else:
+            delimiter = clipboard_delimiters[source_index]
+            text = QApplication.clipboard().text()
+            if not text.strip():
+                msg = QMessageBox(self)
+                msg.setWindowTitle("提示")
+                msg.setText("剪貼簿沒有文字")
+                msg.setIcon(QMessageBox.Information)
+                msg.setWindowModality(Qt.WindowModal)
+                msg.exec()
+                return
+
+        existing_names = {item['name'] for item in self.items}
+        self.bulk_import_worker = BulkImportWorker(existing_names, text=text, path=path, delimiter=delimiter, parent=self)
+        self.bulk_import_worker.parsed.connect(self.apply_bulk_import)
+        self.bulk_import_worker.failed.connect(self.on_bulk_import_failed)
+        self.bulk_import_btn.setEnabled(False)
+        self.bulk_import_btn.setText("匯入中...")
+        self.bulk_import_worker.start()
+
+    def apply_bulk_import(self, new_items, skipped, rejected):
+        """一次加入所有選項：列表、轉盤與存檔各只更新一次"""
+        self.bulk_import_btn.setEnabled(True)
+        self.bulk_import_btn.setText("批次匯入 (CSV/TXT/剪貼簿)")
+        if new_items:
+            self.items.extend(new_items)
+            # 只插入新列，不重設模型：抽中移除模式中途加入的選項不會讓已抽出者回到轉盤
+            self.item_model.items_appended(len(new_items))
+            self.update_wheel()
+            self.auto_save_items()
+            self.save_settings()
+
+        msg = QMessageBox(self)
+        msg.setWindowTitle("批次匯入")
+        text = f"已匯入 {len(new_items)} 個選項"
+        if skipped:
+            text += f"\n略過重複名稱 {skipped} 個"
+        if rejected:
+            shown = "、".join(f"第 {line_no} 行 \"{cell}\"" for line_no, cell in rejected[:5])
+            more = f" 等 {len(rejected)} 行" if len(rejected) > 5 else ""
+            text += f"\n權重無法解析而未匯入：{shown}{more}"
+        msg.setText(text)
+        msg.setIcon(QMessageBox.Warning if rejected else QMessageBox.Information)
+        msg.setWindowModality(Qt.WindowModal)
+        msg.exec()
+
+    def on_bulk_import_failed(self, error):
+        self.bulk_import_btn.setEnabled(True)
+        self.bulk_import_btn.setText("批次匯入 (CSV/TXT/剪貼簿)")
+        msg = QMessageBox(self)
+        msg.setWindowTitle("錯誤")
+        msg.setText(f"匯入失敗: {error}")
+        msg.setIcon(QMessageBox.Critical)
+        msg.setWindowModality(Qt.WindowModal)
+        msg.exec()
+
+    def load_item_for_edit(self, index):
         """載入選項以進行編輯"""
-        row = self.item_list.row(list_item)
+        row = index.row()
         item = self.items[row]
         self.name_input.setText(item['name'])
         self.weight_input.setValue(float(item['weight']))
@@ -1123,10 +1332,9 @@ class ConfigWindow(QWidget):
 
     def remove_item(self):
         """移除選項"""
-        row = self.item_list.currentRow()
+        row = self.item_list.currentIndex().row()
         if row >= 0:
-            self.items.pop(row)
-            self.update_list()
+            self.item_model.remove_row(row)
             self.update_wheel()
             self.auto_save_items() # Call auto_save_items here
             if row == self.editing_index:
@@ -1141,23 +1349,18 @@ class ConfigWindow(QWidget):
 
     def move_item_up(self):
         """上移選項"""
-        row = self.item_list.currentRow()
+        row = self.item_list.currentIndex().row()
         if row > 0:
-            self.items[row], self.items[row-1] = self.items[row-1], self.items[row]
-            self.update_list()
-            self.item_list.setCurrentRow(row-1)
-            self.update_wheel()
-            self.auto_save_items() # Call auto_save_items here
+            # rowsMoved -> on_list_reordered 會更新轉盤與存檔
+            self.item_model.move_row(row, row-1)
+            self.item_list.setCurrentIndex(self.item_model.index(row-1))
             
     def move_item_down(self):
         """下移選項"""
-        row = self.item_list.currentRow()
+        row = self.item_list.currentIndex().row()
         if row >= 0 and row < len(self.items) - 1:
-            self.items[row], self.items[row+1] = self.items[row+1], self.items[row]
-            self.update_list()
-            self.item_list.setCurrentRow(row+1)
-            self.update_wheel()
-            self.auto_save_items() # Call auto_save_items here
+            self.item_model.move_row(row, row+1)
+            self.item_list.setCurrentIndex(self.item_model.index(row+1))
             
     def test_wheel(self):
         """開啟測試轉盤"""
@@ -1182,57 +1385,56 @@ class ConfigWindow(QWidget):
             self.separator_check.isChecked()
         )
         self.test_window.weights_changed.connect(self.on_weights_changed_from_wheel)
+        self.test_window.weights_previewed.connect(self.item_model.weights_changed)
         self.test_window.show()
 
     def on_weights_changed_from_wheel(self):
-        """從轉盤更新權重時的回調"""
-        self.update_list()
+        """從轉盤更新權重時的回調 (拖曳放開時一次)"""
+        self.item_model.weights_changed()
         self.auto_save_items() # Call auto_save_items here
         self.save_settings()
         self.update_wheel()
 
     def update_list(self):
-        """更新選項列表"""
+        """重設選項列表 (self.items 整份替換時呼叫；單筆變更改用 item_model 的通知)"""
         # 保存捲動位置
         scroll_bar = self.item_list.verticalScrollBar()
         current_scroll = scroll_bar.value()
         
-        self.item_list.clear()
-        
-        active_items = [i for i in self.items if i.get('enabled', True)]
-        total_weight = sum(i['weight'] for i in active_items)
-        
-        for i, item in enumerate(self.items):
-            list_item = QListWidgetItem()
-            self.item_list.addItem(list_item)
-            
-            prob = 0
-            if item.get('enabled', True) and total_weight > 0:
-                prob = (item['weight'] / total_weight) * 100
-                
-            widget = ItemWidget(item['name'], item['weight'], item['color'], prob, item.get('enabled', True), item.get('sound_enable', False), item.get('sound_file', ""))
-            widget.toggled.connect(lambda checked, idx=i: self.on_item_toggled(idx, checked))
-            widget.sound_toggled.connect(lambda checked, idx=i: self.on_item_sound_toggled(idx, checked))
-            widget.import_clicked.connect(lambda idx=i: self.on_item_import_clicked(idx))
-            
-            list_item.setSizeHint(widget.sizeHint())
-            list_item.setData(Qt.UserRole, item)
-            self.item_list.setItemWidget(list_item, widget)
+        self.item_model.set_items(self.items)
+        self.restore_removed_btn.setEnabled(False)
             
         # 恢復捲動位置
         scroll_bar.setValue(current_scroll)
 
+    def on_wheel_item_removed(self, wheel_index):
+        """抽中移除：記錄於本場次 (不改變存檔的啟用狀態)，列表在事件迴圈空閒時一次更新"""
+        if not (0 <= wheel_index < len(self.active_rows)):
+            return
+        item = self.items[self.active_rows[wheel_index]]
+        self.item_model.removed_items[id(item)] = item
+        if not self.removed_rows_pending:
+            QTimer.singleShot(0, self.flush_removed_items)
+        self.removed_rows_pending.append(wheel_index)
+
+    def flush_removed_items(self):
+        """更新各列機率 (不重建列表)"""
+        self.removed_rows_pending = []
+        self.item_model.weights_changed()
+        self.restore_removed_btn.setEnabled(bool(self.item_model.removed_items))
+
+    def restore_removed_items(self):
+        """將本場次抽中移除的選項放回轉盤"""
+        self.item_model.removed_items.clear()
+        self.restore_removed_btn.setEnabled(False)
+        self.item_model.weights_changed()
+        self.update_wheel()
+        if self.wheel_window:
+            # 移除的選項仍留在轉盤的 items 中，比對鍵不變，需明確重建權重
+            self.wheel_window.restore_items()
+
     def on_list_reordered(self, parent, start, end, destination, row):
-        """列表重新排序時的回調"""
-        new_items = []
-        for i in range(self.item_list.count()):
-            list_item = self.item_list.item(i)
-            item_data = list_item.data(Qt.UserRole)
-            if item_data:
-                new_items.append(item_data)
-        
-        self.items = new_items
-        self.update_list()
+        """列表重新排序時的回調 (model 已直接調整 self.items 的順序)"""
         self.update_wheel()
         self.auto_save_items() # Call auto_save_items here
         self.save_settings()
@@ -1241,7 +1443,7 @@ class ConfigWindow(QWidget):
         """選項啟用/停用切換"""
         if 0 <= index < len(self.items):
             self.items[index]['enabled'] = checked
-            self.update_list()
+            self.item_model.weights_changed()
             self.update_wheel()
             self.auto_save_items()
             self.save_settings()
@@ -1250,6 +1452,7 @@ class ConfigWindow(QWidget):
         """選項音效啟用/停用切換"""
         if 0 <= index < len(self.items):
             self.items[index]['sound_enable'] = checked
+            self.item_model.row_changed(index)
             self.auto_save_items()
             self.save_settings()
 
@@ -1280,43 +1483,27 @@ class ConfigWindow(QWidget):
                 return
                 
             try:
-                sound_dir = external_path("SOUND")
-                if not os.path.exists(sound_dir):
-                    os.makedirs(sound_dir)
-                    
-                target_filename = os.path.basename(src_path)
-                target_path = os.path.join(sound_dir, target_filename)
-                
-                # Release locks if WheelWindow exists
-                if self.wheel_window:
-                    self.wheel_window.release_audio_locks()
-
-                # Execute Copy (Standard copy will overwrite if exists)
-                if os.path.exists(target_path):
-                     # If it's the exact same file (same path), do nothing
-                     if os.path.abspath(target_path) == os.path.abspath(src_path):
-                         pass
-                     else:
-                         try:
-                             os.remove(target_path)
-                         except:
-                             pass
-                         shutil.copy2(src_path, target_path)
-                else:
-                     shutil.copy2(src_path, target_path)
+                # 以內容雜湊命名存入 SOUND/：相同內容只存一份，已存在時不複製，
+                # 也不會覆蓋其他選項正在使用的檔案 (不需釋放音效)
+                target_filename, copied = store_file(src_path, "SOUND")
                 
                 # Update item data
                 self.items[index]['sound_enable'] = True
                 self.items[index]['sound_file'] = target_filename
+                self.items[index]['sound_name'] = os.path.basename(src_path)
+                self.item_model.row_changed(index)
                 
                 # Reload wheel sounds
                 if self.wheel_window:
+                    if copied:
+                        # 立即更新索引 (不等待檔案監看)
+                        self.wheel_window.assets.refresh("SOUND")
                     self.wheel_window.load_sounds()
                 self.auto_save_items()
                 self.save_settings()
                 
                 msg = QMessageBox(self)
-                msg.setText(f"已匯入選項音效: {target_filename}")
+                msg.setText(f"已匯入選項音效: {os.path.basename(src_path)}")
                 msg.setIcon(QMessageBox.Information)
                 msg.setWindowModality(Qt.WindowModal)
                 msg.exec()
@@ -1366,15 +1553,18 @@ class ConfigWindow(QWidget):
         """執行儲存"""
         self.current_file_path = file_name
         self.auto_save_items()
-        self.save_settings(last_file=file_name)
+        self.save_settings()
+        # 手動儲存需確實寫入後才提示成功
+        self.items_writer.flush()
+        self.settings_writer.flush()
         QMessageBox.information(self, "成功", "設定已儲存")
 
     def auto_save_items(self):
-        """自動儲存選項至當前檔案"""
-        target_file = self.current_file_path
-        if not target_file:
-            target_file = external_path("autosave.json")
-            
+        """自動儲存選項至當前檔案 (延遲合併寫入)"""
+        self.items_writer.mark_dirty()
+
+    def items_data(self):
+        """選項的可序列化資料"""
         data = []
         for item in self.items:
             data.append({
@@ -1383,13 +1573,17 @@ class ConfigWindow(QWidget):
                 'color': item['color'].name(),
                 'enabled': item.get('enabled', True),
                 'sound_enable': item.get('sound_enable', False),
-                'sound_file': item.get('sound_file', "")
+                'sound_file': item.get('sound_file', ""),
+                'sound_name': item.get('sound_name', "")
             })
-        try:
-            with open(target_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-        except:
-            pass # Silent fail for auto-save
+        return data
+
+    def items_snapshot(self):
+        """自動儲存快照 (寫入目標於寫入當下決定)"""
+        target_file = self.current_file_path
+        if not target_file:
+            target_file = external_path("autosave.json")
+        return target_file, self.items_data()
 
     def load_items_dialog(self):
         """載入選項對話框"""
@@ -1417,7 +1611,7 @@ class ConfigWindow(QWidget):
                 # 驗證音效路徑是否存在
                 sound_file = item_data.get('sound_file', "")
                 sound_enable = item_data.get('sound_enable', False)
-                if sound_file and not os.path.exists(sound_file):
+                if sound_file and not sound_exists(sound_file):
                     sound_file = ""  # 路徑不存在，重置為預設
                     sound_enable = False
                 
@@ -1427,7 +1621,8 @@ class ConfigWindow(QWidget):
                     'color': QColor(item_data['color']),
                     'enabled': item_data.get('enabled', True),
                     'sound_enable': sound_enable,
-                    'sound_file': sound_file
+                    'sound_file': sound_file,
+                    'sound_name': item_data.get('sound_name', "") if sound_file else ""
                 })
             
             self.update_list()
@@ -1454,10 +1649,13 @@ class ConfigWindow(QWidget):
             msg.setWindowModality(Qt.WindowModal)
             msg.exec()
 
-    def save_settings(self, last_file=None):
-        """儲存設定"""
-        if last_file is None:
-            last_file = self.current_file_path
+    def save_settings(self):
+        """儲存設定 (標記變更，閒置後於背景寫入)"""
+        self.settings_writer.mark_dirty()
+
+    def settings_snapshot(self):
+        """設定快照 (於 GUI 執行緒複製，序列化交給背景執行緒)"""
+        last_file = self.current_file_path
 
         settings = {
             "result_text_color": self.result_text_color.name(),
@@ -1474,32 +1672,30 @@ class ConfigWindow(QWidget):
             
             "wheel_mode": self.wheel_mode,
             "pointer_image_path": self.pointer_image_path,
+            "pointer_image_name": self.pointer_image_name,
             "pointer_angle_offset": self.pointer_angle_offset,
             "pointer_scale": self.pointer_scale,
             "spin_speed_multiplier": self.spin_speed_multiplier,
             "classic_pointer_angle": self.classic_pointer_angle,
             "center_text": self.center_text,
             "show_pointer_line": self.show_pointer_line,
+            "remove_winner_enabled": self.remove_winner_check.isChecked(),
             "panel_expanded": self.panel_expanded,
             "input_panel_expanded": self.input_group.toggle_btn.isChecked() if hasattr(self, 'input_group') else True,
             "style_panel_expanded": self.style_group.toggle_btn.isChecked() if hasattr(self, 'style_group') else True,
-            "history_sessions": self.history_sessions,
             "curr_session_idx": self.curr_session_idx
         }
         
         if last_file:
             settings["last_file"] = last_file
 
-        try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=4)
-        except:
-            pass
+        return SETTINGS_FILE, settings
 
     def load_last_settings(self):
         """載入上次的設定"""
         print(f"DEBUG: Loading settings... File: {__file__}")
         items_loaded = False
+        legacy_sessions = None
         if os.path.exists(SETTINGS_FILE):
             try:
                 with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
@@ -1532,6 +1728,9 @@ class ConfigWindow(QWidget):
                 if "finish_sound_enabled" in settings:
                     self.finish_sound_check.setChecked(settings["finish_sound_enabled"])
 
+                if "remove_winner_enabled" in settings:
+                    self.remove_winner_check.setChecked(settings["remove_winner_enabled"])
+
                 if "result_opacity" in settings:
                     self.result_opacity = settings["result_opacity"]
                     slider_val = int(self.result_opacity / 2.55)
@@ -1571,21 +1770,20 @@ class ConfigWindow(QWidget):
                     self.style_group.toggle_btn.setChecked(settings["style_panel_expanded"])
 
                 if "history_sessions" in settings:
-                    self.history_sessions = settings["history_sessions"]
+                    legacy_sessions = settings["history_sessions"]
                 if "curr_session_idx" in settings:
                     self.curr_session_idx = settings["curr_session_idx"]
-                    # Boundary check
-                    if self.curr_session_idx >= len(self.history_sessions):
-                        self.curr_session_idx = 0
 
                 # 載入新設定
                 # 載入新設定
                 self.wheel_mode = settings.get('wheel_mode', 'classic')
                 self.pointer_image_path = settings.get('pointer_image_path', "")
+                self.pointer_image_name = settings.get('pointer_image_name', "")
                 
                 # Check if image exists, if not fallback to default
                 if not self.pointer_image_path or not os.path.exists(self.pointer_image_path):
                      default_path = resource_path(os.path.join("PIC", "ee.png"))
+                     self.pointer_image_name = ""
                      if os.path.exists(default_path):
                          self.pointer_image_path = default_path
                          self.pointer_angle_offset = 335 # Default for ee.png
@@ -1613,7 +1811,7 @@ class ConfigWindow(QWidget):
                     self.classic_mode_container.setVisible(False)
 
                 if self.pointer_image_path:
-                    self.image_path_label.setText(os.path.basename(self.pointer_image_path))
+                    self.image_path_label.setText(self.pointer_image_name or os.path.basename(self.pointer_image_path))
                 else:
                     self.image_path_label.setText("未選擇圖片")
                 
@@ -1647,7 +1845,7 @@ class ConfigWindow(QWidget):
                     self.classic_mode_container.setVisible(True)
                     
                 if hasattr(self, 'image_path_label'):
-                    self.image_path_label.setText(os.path.basename(self.pointer_image_path))
+                    self.image_path_label.setText(self.pointer_image_name or os.path.basename(self.pointer_image_path))
                 
                 if self.pointer_image_path and os.path.exists(self.pointer_image_path):
                      if hasattr(self, 'calibrate_btn'):
@@ -1663,7 +1861,7 @@ class ConfigWindow(QWidget):
                             # 驗證音效路徑是否存在
                             sound_file = item_data.get('sound_file', "")
                             sound_enable = item_data.get('sound_enable', False)
-                            if sound_file and not os.path.exists(sound_file):
+                            if sound_file and not sound_exists(sound_file):
                                 sound_file = ""
                                 sound_enable = False
                             
@@ -1673,7 +1871,8 @@ class ConfigWindow(QWidget):
                                 'color': QColor(item_data['color']),
                                 'enabled': item_data.get('enabled', True),
                                 'sound_enable': sound_enable,
-                                'sound_file': sound_file
+                                'sound_file': sound_file,
+                                'sound_name': item_data.get('sound_name', "") if sound_file else ""
                             })
                         self.update_list()
                         items_loaded = True
@@ -1684,6 +1883,8 @@ class ConfigWindow(QWidget):
                 traceback.print_exc()
                 QMessageBox.critical(self, "錯誤", f"載入失敗: {str(e)}")
         
+        self.load_history(legacy_sessions)
+        
         # If items not loaded (settings missing, last_file missing, or load failed), try autosave
         if not items_loaded:
              autosave_path = external_path("autosave.json")
@@ -1697,7 +1898,7 @@ class ConfigWindow(QWidget):
                         # 驗證音效路徑是否存在
                         sound_file = item_data.get('sound_file', "")
                         sound_enable = item_data.get('sound_enable', False)
-                        if sound_file and not os.path.exists(sound_file):
+                        if sound_file and not sound_exists(sound_file):
                             sound_file = ""
                             sound_enable = False
                         
@@ -1707,7 +1908,8 @@ class ConfigWindow(QWidget):
                             'color': QColor(item_data['color']),
                             'enabled': item_data.get('enabled', True),
                             'sound_enable': sound_enable,
-                            'sound_file': sound_file
+                            'sound_file': sound_file,
+                            'sound_name': item_data.get('sound_name', "") if sound_file else ""
                         })
                     self.update_list()
                  except:
@@ -1716,7 +1918,7 @@ class ConfigWindow(QWidget):
     def toggle_wheel(self):
         """切換轉盤視窗"""
         if self.wheel_window is None:
-            active_items = [i for i in self.items if i.get('enabled', True)]
+            active_items = [i for i in self.items if self.item_model.is_active(i)]
             if not active_items:
                 msg = QMessageBox(self)
                 msg.setWindowTitle("警告")
@@ -1729,6 +1931,7 @@ class ConfigWindow(QWidget):
             self.update_wheel()
             self.wheel_window.show()
             self.wheel_window.spin_finished.connect(self.add_history_record)
+            self.wheel_window.item_removed.connect(self.on_wheel_item_removed)
             self.wheel_window.window_closed.connect(self.on_wheel_closed)
             
             # 立即應用所有設定 (包含速度)
@@ -1738,6 +1941,7 @@ class ConfigWindow(QWidget):
             
             self.multi_spin_setup_btn.setEnabled(True)
             self.multi_spin_setup_btn.setStyleSheet("background-color: #673AB7;")
+            self.record_btn.setEnabled(self.record_process is None)
         else:
             self.wheel_window.close()
             
@@ -1748,6 +1952,7 @@ class ConfigWindow(QWidget):
         
         self.multi_spin_setup_btn.setEnabled(False)
         self.multi_spin_setup_btn.setStyleSheet("background-color: #9E9E9E;")
+        self.record_btn.setEnabled(False)
         
         if self.is_auto_spinning:
             self.is_auto_spinning = False
@@ -1777,29 +1982,19 @@ class ConfigWindow(QWidget):
             if files:
                 src_path = files[0]
                 
-                # 確保外部 PIC 資料夾存在
-                pic_dir = external_path("PIC")
-                if not os.path.exists(pic_dir):
-                    try:
-                        os.makedirs(pic_dir)
-                    except:
-                        pass # Should handle permission error?
-                        
-                # 複製檔案到 PIC 資料夾
+                # 以內容雜湊命名存入 PIC 資料夾 (相同圖片不重複複製)
                 try:
                     filename = os.path.basename(src_path)
-                    dest_path = os.path.join(pic_dir, filename)
-                    
-                    # 避免同名覆蓋確認? 使用者需求是簡單複製
-                    shutil.copy2(src_path, dest_path)
+                    stored_name, _ = store_file(src_path, "PIC")
                     
-                    self.pointer_image_path = dest_path
+                    self.pointer_image_path = external_path(os.path.join("PIC", stored_name))
+                    self.pointer_image_name = filename
                     self.image_path_label.setText(filename)
                     self.calibrate_btn.setEnabled(True)
                     self.update_wheel_settings()
                     self.save_settings()
                     
-                    QMessageBox.information(self, "成功", f"圖片已複製到: PIC/{filename}")
+                    QMessageBox.information(self, "成功", f"已匯入指針圖片: {filename}")
                     
                 except Exception as e:
                     msg = QMessageBox(self)
@@ -1811,7 +2006,8 @@ class ConfigWindow(QWidget):
                     # Fallback to source path? Or just fail? 
                     # Use source path as fallback if copy fails
                     self.pointer_image_path = src_path
-                    self.image_path_label.setText(os.path.basename(src_path))
+                    self.pointer_image_name = os.path.basename(src_path)
+                    self.image_path_label.setText(self.pointer_image_name)
                     self.update_wheel_settings()
                     self.save_settings()
 
@@ -1849,38 +2045,33 @@ class ConfigWindow(QWidget):
             self.pointer_line_btn.setStyleSheet("background-color: #f44336; color: white;")
 
     def update_wheel(self):
-        """更新轉盤設定"""
+        """更新轉盤設定 (只有變更的部分會被套用)"""
         if self.wheel_window:
-            active_items = [i for i in self.items if i.get('enabled', True)]
-            self.wheel_window.update_settings(
-                active_items, 
-                self.border_enabled_check(), 
-                self.border_color, 
-                self.result_text_color,
-                self.result_bg_color,
+            self.active_rows = [row for row, i in enumerate(self.items) if self.item_model.is_active(i)]
+            active_items = [self.items[row] for row in self.active_rows]
+            self.wheel_window.apply_settings(active_items, self.wheel_settings())
+
+    def wheel_settings(self):
+        """轉盤設定快照 (可比較的 tuple/值，供 WheelWindow.apply_settings 比對)"""
+        return {
+            'style': (
+                self.border_enabled_check(),
+                QColor(self.border_color),
+                QColor(self.result_text_color),
+                QColor(self.result_bg_color),
                 self.separator_check.isChecked(),
                 self.sound_check.isChecked(),
                 self.finish_sound_check.isChecked(),
                 int(self.opacity_slider.value() * 2.55),
                 self.show_pointer_line,
                 self.continuous_sound_check.isChecked()
-            )
-            self.wheel_window.set_classic_settings(self.classic_pointer_angle, self.center_text)
-            # 應用新的模式設定
-            self.wheel_window.set_mode(
-                self.wheel_mode,
-                self.pointer_image_path,
-                self.pointer_angle_offset,
-                self.pointer_scale
-            )
-            
-            # 設定置頂/工具
-            self.wheel_window.set_window_mode(self.window_mode)
-            
-            # 同步速度 (僅在未旋轉時更新，避免影響目前物理運算，雖物理運算其實已鎖定初速)
-            if not self.wheel_window.is_spinning:
-                self.wheel_window.spin_speed_multiplier = self.spin_speed_multiplier
-
+            ),
+            'classic': (self.classic_pointer_angle, self.center_text),
+            'mode': (self.wheel_mode, self.pointer_image_path, self.pointer_angle_offset, self.pointer_scale),
+            'remove_winners': self.remove_winner_check.isChecked(),
+            'window_mode': self.window_mode,
+            'speed': self.spin_speed_multiplier,
+        }
 
     def on_window_mode_changed(self, index):
         """視窗模式變更時的回調"""
@@ -1984,16 +2175,13 @@ class ConfigWindow(QWidget):
                             self.wheel_window.load_sounds()
                         return
                 
-                # 執行複製 (若有同名同格式會覆蓋)
-                if os.path.exists(target_path):
-                    try:
-                        os.remove(target_path)
-                    except:
-                        pass
-                shutil.copy2(src_path, target_path)
+                # 執行複製 (若有同名同格式會覆蓋；內容相同時略過)
+                copied = copy_if_changed(src_path, target_path)
                 
                 # 更新轉盤
                 if self.wheel_window:
+                    if copied:
+                        self.wheel_window.assets.refresh("SOUND")
                     self.wheel_window.load_sounds()
                 
                 msg = QMessageBox(self)
@@ -2054,25 +2242,18 @@ class ConfigWindow(QWidget):
 
     def closeEvent(self, event):
         """視窗關閉事件"""
+        # 確保延遲中的寫入全部完成，不遺失任何變更
+        self.save_settings()
+        self.items_writer.flush()
+        self.settings_writer.flush()
+
         # 自動儲存至 autosave.json
         try:
-            autosave_path = external_path("autosave.json")
-            data = []
-            for item in self.items:
-                data.append({
-                    'name': item['name'],
-                    'weight': item['weight'],
-                    'color': item['color'].name(),
-                    'enabled': item.get('enabled', True),
-                    'sound_enable': item.get('sound_enable', False),
-                    'sound_file': item.get('sound_file', "")
-                })
-            with open(autosave_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            atomic_write_json(external_path("autosave.json"), self.items_data())
         except:
             pass
-
-        self.save_settings()
+        self.save_current_memo()
+        self.history_journal.close()
         if self.wheel_window:
             self.wheel_window.close()
         super().closeEvent(event)
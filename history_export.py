@@ -0,0 +1,79 @@
+import csv
+from datetime import datetime
+from itertools import zip_longest
+
+from PySide6.QtCore import QThread, Signal
+
+FORMAT_WIDE = "wide"   # 每場次一欄 (原本的轉置格式)
+FORMAT_LONG = "long"   # 每筆結果一列: 場次, 序號, 項目, 時間
+
+PROGRESS_STEP = 1000   # 每寫入多少列回報一次進度
+
+
+def format_timestamp(t):
+    if t is None:
+        return ""
+    return datetime.fromtimestamp(t).isoformat(sep=' ', timespec='milliseconds')
+
+
+def write_wide(writer, sessions, progress=None):
+    """轉置格式：第 1 列場次編號、第 2 列備註，之後每列為各場次的第 i 筆結果"""
+    writer.writerow([f"紀錄 {i+1}" for i in range(len(sessions))])
+    writer.writerow([s.get('memo', '') for s in sessions])
+    total = max((len(s.get('data', [])) for s in sessions), default=0)
+    # 每個場次只走訪一次 (Old -> New)
+    for i, row in enumerate(zip_longest(*(s.get('data', []) for s in sessions), fillvalue=""), 1):
+        writer.writerow(row)
+        if progress and i % PROGRESS_STEP == 0:
+            progress(i, total)
+    if progress:
+        progress(total, total)
+
+
+def write_long(writer, sessions, progress=None):
+    """長格式：每筆結果一列"""
+    writer.writerow(["session", "index", "item", "timestamp"])
+    total = sum(len(s.get('data', [])) for s in sessions)
+    done = 0
+    for session_no, s in enumerate(sessions, 1):
+        data = s.get('data', [])
+        times = s.get('times', [])
+        for index, (item, t) in enumerate(zip_longest(data, times[:len(data)]), 1):
+            writer.writerow([session_no, index, item, format_timestamp(t)])
+            done += 1
+            if progress and done % PROGRESS_STEP == 0:
+                progress(done, total)
+    if progress:
+        progress(total, total)
+
+
+def export_history(path, sessions, fmt=FORMAT_WIDE, progress=None):
+    """邊產生邊寫入 CSV"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.writer(csvfile)
+        if fmt == FORMAT_LONG:
+            write_long(writer, sessions, progress)
+        else:
+            write_wide(writer, sessions, progress)
+
+
+class HistoryExportWorker(QThread):
+    """於背景執行緒讀取紀錄日誌並匯出 CSV"""
+    progress = Signal(int, int)
+    succeeded = Signal(str)
+    failed = Signal(str)
+
+    def __init__(self, path, journal, fmt=FORMAT_WIDE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.journal = journal
+        self.fmt = fmt
+
+    def run(self):
+        try:
+            sessions = self.journal.load_all() or [{"data": [], "memo": ""}]
+            export_history(self.path, sessions, self.fmt, self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit(self.path)
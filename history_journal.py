@@ -0,0 +1,209 @@
+import json
+import os
+import threading
+
+
+def new_session():
+    """空白紀錄場次"""
+    return {"data": [], "memo": "", "times": []}
+
+
+class HistoryJournal:
+    """歷史紀錄追加式日誌 (JSONL，每筆結果一行)
+
+    每行都以 {"s": 場次, ...} 開頭，啟動時只需解析目前場次的行；
+    其餘場次在切換或匯出時才讀取。日誌過長時於背景執行緒壓縮為每場次一行。
+    """
+    COMPACT_MIN_LINES = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+        self.line_count = 0
+        self.session_count = 0
+        self.generation = 0 # clear_all 時遞增，讓進行中的壓縮作廢
+        self.compact_thread = None
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    # --- 寫入 ---
+    def append(self, record):
+        """追加一行紀錄"""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self.lock:
+            try:
+                if self.file is None:
+                    self.file = open(self.path, 'a', encoding='utf-8')
+                self.file.write(line)
+                self.file.flush()
+            except Exception as e:
+                print(f"Error writing history journal: {e}")
+                return
+            self.line_count += 1
+            self.session_count = max(self.session_count, record["s"] + 1)
+        if self.line_count > max(self.COMPACT_MIN_LINES, self.session_count * 2):
+            self.compact_async()
+
+    def append_results(self, session, names, times):
+        """新增轉動結果 (多筆合併為一行)"""
+        if len(names) == 1:
+            self.append({"s": session, "op": "add", "item": names[0], "t": times[0]})
+        elif names:
+            self.append({"s": session, "op": "add_many", "items": names, "t": times})
+
+    def set_memo(self, session, memo):
+        self.append({"s": session, "op": "memo", "memo": memo})
+
+    def clear_session(self, session):
+        self.append({"s": session, "op": "clear"})
+
+    def add_session(self, session):
+        self.append({"s": session, "op": "new"})
+
+    def clear_all(self):
+        """清除全部紀錄 (直接清空檔案)"""
+        with self.lock:
+            self.generation += 1
+            if self.file:
+                self.file.close()
+                self.file = None
+            try:
+                open(self.path, 'w', encoding='utf-8').close()
+            except Exception as e:
+                print(f"Error clearing history journal: {e}")
+            self.line_count = 0
+            self.session_count = 0
+
+    def import_sessions(self, sessions):
+        """由舊版 settings.json 的 history_sessions 轉入日誌"""
+        for i, session in enumerate(sessions):
+            self.append(self.session_record(i, session))
+
+    @staticmethod
+    def session_record(index, session):
+        data = list(session.get("data", []))
+        times = list(session.get("times", []))
+        return {"s": index, "op": "session", "data": data, "memo": session.get("memo", ""),
+                "times": times + [None] * (len(data) - len(times))}
+
+    # --- 讀取 ---
+    @staticmethod
+    def apply(sessions, record):
+        """將一行紀錄套用到場次字典"""
+        session = sessions.setdefault(record["s"], new_session())
+        op = record.get("op")
+        if op == "add":
+            session["data"].append(record["item"])
+            session["times"].append(record.get("t"))
+        elif op == "add_many":
+            session["data"].extend(record["items"])
+            session["times"].extend(record.get("t") or [None] * len(record["items"]))
+        elif op == "memo":
+            session["memo"] = record.get("memo", "")
+        elif op == "clear":
+            session["data"] = []
+            session["times"] = []
+            session["memo"] = ""
+        elif op == "session":
+            session["data"] = list(record.get("data", []))
+            session["times"] = list(record.get("times") or [None] * len(session["data"]))
+            session["memo"] = record.get("memo", "")
+
+    def replay(self, only_session=None, limit=None):
+        """重播日誌；only_session 指定時只解析該場次的行"""
+        sessions = {}
+        count = 0
+        max_session = -1
+        if not os.path.exists(self.path):
+            return sessions, count, max_session
+        prefix = f'{{"s": {only_session}, ' if only_session is not None else None
+        with self.lock:
+            with open(self.path, 'rb') as f:
+                data = f.read(limit) if limit is not None else f.read()
+        for raw in data.splitlines():
+            line = raw.decode('utf-8', errors='replace')
+            if not line.startswith('{"s": '):
+                continue
+            count += 1
+            try:
+                max_session = max(max_session, int(line[6:line.index(',', 6)]))
+            except ValueError:
+                continue
+            if prefix and not line.startswith(prefix):
+                continue
+            try:
+                self.apply(sessions, json.loads(line))
+            except (ValueError, KeyError):
+                continue # 寫到一半的最後一行
+        return sessions, count, max_session
+
+    def load_current(self, session_index):
+        """啟動時只重播目前場次，回傳 (場次資料, 場次數量)"""
+        sessions, count, max_session = self.replay(only_session=session_index)
+        with self.lock:
+            self.line_count = count
+            self.session_count = max_session + 1
+        if count > max(self.COMPACT_MIN_LINES, self.session_count * 2):
+            self.compact_async()
+        return sessions.get(session_index, new_session()), self.session_count
+
+    def load_session(self, session_index):
+        sessions, _, _ = self.replay(only_session=session_index)
+        return sessions.get(session_index, new_session())
+
+    def load_all(self):
+        """讀取全部場次 (匯出用)"""
+        sessions, _, max_session = self.replay()
+        return [sessions.get(i, new_session()) for i in range(max_session + 1)]
+
+    # --- 壓縮 ---
+    def compact_async(self):
+        """於背景執行緒將日誌壓縮為每場次一行"""
+        if self.compact_thread and self.compact_thread.is_alive():
+            return
+        self.compact_thread = threading.Thread(target=self.compact, daemon=True)
+        self.compact_thread.start()
+
+    def compact(self):
+        with self.lock:
+            if self.file:
+                self.file.flush()
+            generation = self.generation
+            try:
+                offset = os.path.getsize(self.path)
+            except OSError:
+                return
+        sessions, _, max_session = self.replay(limit=offset)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for i in range(max_session + 1):
+                    record = self.session_record(i, sessions.get(i, new_session()))
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            with self.lock:
+                if generation != self.generation:
+                    os.remove(tmp_path)
+                    return
+                # 壓縮期間新增的行接在後面，再原子取代
+                with open(self.path, 'rb') as src:
+                    src.seek(offset)
+                    tail = src.read()
+                with open(tmp_path, 'ab') as f:
+                    f.write(tail)
+                if self.file:
+                    self.file.close()
+                    self.file = None
+                os.replace(tmp_path, self.path)
+                self.line_count = max_session + 1 + tail.count(b"\n")
+        except Exception as e:
+            print(f"Error compacting history journal: {e}")
+
+    def close(self):
+        if self.compact_thread:
+            self.compact_thread.join()
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
@@ -0,0 +1,128 @@
+import bisect
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+# 一次新增超過此數量時直接重設模型 (即時連抽)，比逐列通知快
+RESET_THRESHOLD = 200
+
+
+class HistoryModel(QAbstractListModel):
+    """轉動紀錄列表模型
+
+    個別顯示：最新結果在最上方，新增一筆只插入一列。
+    合併顯示：維護各項目的累計次數與排序 (次數多者在前，同次數依首次出現順序)，
+    新增一筆以二分搜尋 (O(log n)) 找到位置，只通知一列插入或一列移動/更新；
+    排序串列的插入/移動仍為 O(n) 的元素搬移 (單次 memmove，相較重建所有列很小)。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.data_list = []     # 目前場次的結果 (與場次資料共用)
+        self.shown = 0          # 已通知 view 的結果數量
+        self.grouped = False
+        self.counts = {}        # 項目 -> 次數
+        self.first_seen = {}    # 項目 -> 首次出現序號
+        self.order = []         # 排序鍵 (-次數, 首次出現序號, 項目)
+
+    # --- Qt model ---
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.order) if self.grouped else self.shown
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            if self.grouped:
+                count, _, name = self.order[row]
+                return f"{name} x{-count}"
+            return self.data_list[self.shown - 1 - row]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    # --- 更新 ---
+    def set_session(self, data_list):
+        """切換場次 (重建計數，O(n))"""
+        self.beginResetModel()
+        self.data_list = data_list
+        self.shown = len(data_list)
+        self.rebuild_counts()
+        self.endResetModel()
+
+    def set_grouped(self, grouped):
+        if grouped != self.grouped:
+            self.beginResetModel()
+            self.grouped = grouped
+            if grouped:
+                # 個別顯示時只累計次數，切換時再排序
+                self.sort_counts()
+            self.endResetModel()
+
+    def rebuild_counts(self):
+        self.counts = {}
+        self.first_seen = {}
+        for name in self.data_list[:self.shown]:
+            if name in self.counts:
+                self.counts[name] += 1
+            else:
+                self.counts[name] = 1
+                self.first_seen[name] = len(self.first_seen)
+        self.sort_counts()
+
+    def sort_counts(self):
+        self.order = sorted((-c, self.first_seen[n], n) for n, c in self.counts.items())
+
+    def results_appended(self):
+        """場次資料已追加結果後呼叫，只通知新增的部分"""
+        new_count = len(self.data_list) - self.shown
+        if new_count <= 0:
+            return
+        if new_count > RESET_THRESHOLD:
+            self.set_session(self.data_list)
+            return
+        for name in self.data_list[self.shown:]:
+            self.add_one(name)
+
+    def add_one(self, name):
+        if not self.grouped:
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self.shown += 1
+            self.count_one(name)
+            self.endInsertRows()
+            return
+
+        if name not in self.counts:
+            key = (-1, len(self.first_seen), name)
+            row = bisect.bisect_left(self.order, key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.shown += 1
+            self.count_one(name)
+            self.order.insert(row, key)
+            self.endInsertRows()
+            return
+
+        old_key = (-self.counts[name], self.first_seen[name], name)
+        old_row = bisect.bisect_left(self.order, old_key)
+        new_key = (old_key[0] - 1, old_key[1], name)
+        # 次數 +1 後只會往前移，移到同次數群組中的正確位置
+        new_row = bisect.bisect_left(self.order, new_key, 0, old_row)
+        if new_row != old_row:
+            self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), new_row)
+        self.shown += 1
+        self.count_one(name)
+        del self.order[old_row]
+        self.order.insert(new_row, new_key)
+        if new_row != old_row:
+            self.endMoveRows()
+        index = self.index(new_row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def count_one(self, name):
+        if name in self.counts:
+            self.counts[name] += 1
+        else:
+            self.counts[name] = 1
+            self.first_seen[name] = len(self.first_seen)
@@ -0,0 +1,262 @@
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionButton, QApplication
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QMimeData, QRect, QSize, QEvent, Signal
+from PySide6.QtGui import QColor, QFont, QPen, QCursor, QPalette
+
+ITEM_ROLE = Qt.UserRole
+PROB_ROLE = Qt.UserRole + 1
+
+ROW_MIME = "application/x-wheel-item-row"
+
+
+class ItemListModel(QAbstractListModel):
+    """選項列表模型 (直接使用 ConfigWindow.items，不複製資料)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+        self.total_weight = 0
+        self.removed_items = {} # 本場次抽中移除的選項 id(item) -> item (不寫入存檔)
+
+    def set_items(self, items):
+        """整份列表替換 (載入檔案等)"""
+        self.beginResetModel()
+        self.items = items
+        self.removed_items.clear()
+        self.update_total()
+        self.endResetModel()
+
+    def update_total(self):
+        self.total_weight = sum(i['weight'] for i in self.items if self.is_active(i))
+
+    def is_active(self, item):
+        """選項是否在轉盤上 (已啟用且本場次未被抽中移除)"""
+        return item.get('enabled', True) and id(item) not in self.removed_items
+
+    def probability(self, item):
+        if self.is_active(item) and self.total_weight > 0:
+            return (item['weight'] / self.total_weight) * 100
+        return 0
+
+    # --- Qt model ---
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.items):
+            return None
+        item = self.items[index.row()]
+        if role == Qt.DisplayRole:
+            return item['name']
+        if role == ITEM_ROLE:
+            return item
+        if role == PROB_ROLE:
+            return self.probability(item)
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            return flags | Qt.ItemIsDragEnabled
+        return flags | Qt.ItemIsDropEnabled
+
+    # --- 更新通知 (只重繪受影響的列) ---
+    def row_changed(self, row):
+        """單一選項內容變更 (名稱/顏色/音效)"""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def weights_changed(self):
+        """權重或啟用狀態變更：機率全部改變，但 view 只重繪可見的列"""
+        self.update_total()
+        if self.items:
+            self.dataChanged.emit(self.index(0), self.index(len(self.items) - 1))
+
+    def item_appended(self):
+        """self.items 已追加一筆"""
+        self.items_appended(1)
+
+    def items_appended(self, count):
+        """self.items 已追加 count 筆 (批次匯入)，保留本場次的抽中移除狀態"""
+        if count <= 0:
+            return
+        first = len(self.items) - count
+        self.beginInsertRows(QModelIndex(), first, len(self.items) - 1)
+        self.endInsertRows()
+        self.weights_changed()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.items.pop(row)
+        self.endRemoveRows()
+        self.weights_changed()
+
+    def move_row(self, src, dst):
+        """將 src 列移到 dst 列的位置 (dst 為移動後的索引)"""
+        if src == dst or not (0 <= src < len(self.items)) or not (0 <= dst < len(self.items)):
+            return False
+        # beginMoveRows 的目的地是移動前的插入位置
+        if not self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dst + 1 if dst > src else dst):
+            return False
+        self.items.insert(dst, self.items.pop(src))
+        self.endMoveRows()
+        return True
+
+    # --- 拖曳排序 ---
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self):
+        return [ROW_MIME]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        if indexes:
+            mime.setData(ROW_MIME, str(indexes[0].row()).encode())
+        return mime
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if action != Qt.MoveAction or not data.hasFormat(ROW_MIME):
+            return False
+        src = int(bytes(data.data(ROW_MIME)).decode())
+        if parent.isValid():
+            row = parent.row()
+        if row < 0:
+            row = len(self.items)
+        dst = row - 1 if row > src else row
+        self.move_row(src, dst)
+        # 已自行移動，回傳 False 讓 view 不再刪除來源列
+        return False
+
+
+class ItemDelegate(QStyledItemDelegate):
+    """繪製選項列：核取方塊、顏色、名稱/權重/機率、音效核取與匯入按鈕"""
+    toggled = Signal(int, bool)
+    sound_toggled = Signal(int, bool)
+    import_clicked = Signal(int)
+
+    MARGIN_H = 10
+    MARGIN_V = 8
+    SPACING = 6
+    ROW_HEIGHT = 41
+    INDICATOR = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.info_font = QFont()
+        self.info_font.setPointSizeF(10)
+        self.info_font.setBold(True)
+        self.button_font = QFont()
+        self.button_font.setPixelSize(12)
+        self.button_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def layout(self, rect, item, option):
+        """計算各元件位置 (依 ItemWidget 原本的水平排列)"""
+        cy = rect.center().y()
+        x = rect.left() + self.MARGIN_H
+        check = QRect(x, cy - self.INDICATOR // 2, self.INDICATOR, self.INDICATOR)
+        x = check.right() + 1 + self.SPACING
+        swatch = QRect(x, cy - 10, 20, 20)
+        x = swatch.right() + 1 + self.SPACING
+
+        right = rect.right() - self.MARGIN_H
+        if item.get('sound_file', ""):
+            button = QRect(right - 120 + 1, rect.top() + self.MARGIN_V, 120, rect.height() - 2 * self.MARGIN_V)
+        else:
+            button = QRect(right - 70 + 1, cy - 12, 70, 25)
+        label_width = option.fontMetrics.horizontalAdvance("音效")
+        sound_width = self.INDICATOR + 4 + label_width
+        sound_check = QRect(button.left() - self.SPACING - sound_width, cy - self.INDICATOR // 2,
+                            sound_width, self.INDICATOR)
+        text = QRect(x, rect.top(), max(0, sound_check.left() - self.SPACING - x), rect.height())
+        return check, swatch, text, sound_check, button
+
+    def draw_check(self, painter, option, rect, checked, text=""):
+        opt = QStyleOptionButton()
+        opt.rect = QRect(rect.left(), rect.top(), self.INDICATOR, self.INDICATOR)
+        opt.state = QStyle.State_Enabled | (QStyle.State_On if checked else QStyle.State_Off)
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_IndicatorCheckBox, opt, painter, option.widget)
+        if text:
+            painter.setPen(option.palette.text().color())
+            painter.drawText(rect.adjusted(self.INDICATOR + 4, 0, 0, 0), Qt.AlignVCenter | Qt.AlignLeft, text)
+
+    def paint(self, painter, option, index):
+        item = index.data(ITEM_ROLE)
+        if item is None:
+            return
+        prob = index.data(PROB_ROLE)
+
+        painter.save()
+        # 背景 (選取/滑過) 交給 style 繪製
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        check, swatch, text, sound_check, button = self.layout(option.rect, item, option)
+        self.draw_check(painter, option, check, item.get('enabled', True))
+
+        painter.setPen(QPen(QColor("#555"), 1))
+        painter.setBrush(item['color'])
+        painter.drawRect(swatch.adjusted(0, 0, -1, -1))
+
+        painter.setFont(self.info_font)
+        if item.get('enabled', True) and not index.model().is_active(item):
+            # 本場次已抽中移除 (仍保持勾選，復原後回到轉盤)
+            painter.setPen(option.palette.color(QPalette.Disabled, QPalette.Text))
+        else:
+            painter.setPen(option.palette.text().color())
+        info = f"{item['name']} (W: {item['weight']:.1f} | P: {prob:.1f}%)"
+        info = painter.fontMetrics().elidedText(info, Qt.ElideRight, text.width())
+        painter.drawText(text, Qt.AlignVCenter | Qt.AlignLeft, info)
+
+        painter.setFont(option.font)
+        self.draw_check(painter, option, sound_check, item.get('sound_enable', False), "音效")
+
+        # 匯入音效按鈕
+        sound_file = item.get('sound_file', "")
+        hovered = False
+        if option.widget is not None and option.state & QStyle.State_MouseOver:
+            hovered = button.contains(option.widget.mapFromGlobal(QCursor.pos()))
+        if sound_file:
+            color = "#45a049" if hovered else "#4CAF50"
+            label = f"♪ {item.get('sound_name') or sound_file}"
+        else:
+            color = "#1976D2" if hovered else "#2196F3"
+            label = "匯入音效"
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(button, 3, 3)
+        painter.setFont(self.button_font)
+        painter.setPen(Qt.white)
+        label = painter.fontMetrics().elidedText(label, Qt.ElideRight, button.width() - 4)
+        painter.drawText(button, Qt.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """點擊核取方塊與按鈕 (不建立任何子元件)"""
+        if event.type() not in (QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+        item = index.data(ITEM_ROLE)
+        if item is None:
+            return False
+        check, swatch, text, sound_check, button = self.layout(option.rect, item, option)
+        pos = event.position().toPoint()
+        hit = check.contains(pos) or sound_check.contains(pos) or button.contains(pos)
+        if event.type() == QEvent.MouseButtonDblClick:
+            # 在按鈕上雙擊不觸發編輯
+            return hit
+        row = index.row()
+        if check.contains(pos):
+            self.toggled.emit(row, not item.get('enabled', True))
+        elif sound_check.contains(pos):
+            self.sound_toggled.emit(row, not item.get('sound_enable', False))
+        elif button.contains(pos):
+            self.import_clicked.emit(row)
+        return hit
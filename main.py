@@ -1,8 +1,18 @@
+import os
 import sys
 from PySide6.QtWidgets import QApplication
 from config_window import ConfigWindow
 
+def record(job_path):
+    """離線錄製模式 (由設定視窗以子行程啟動)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    from spin_recorder import run_record_job
+    sys.exit(run_record_job(job_path))
+
 def main():
+    if len(sys.argv) >= 3 and sys.argv[1] == "--record":
+        record(sys.argv[2])
     app = QApplication(sys.argv)
     config_window = ConfigWindow()
     config_window.show()
@@ -0,0 +1,70 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QTimer
+
+
+def atomic_write_json(path, data):
+    """寫入暫存檔後再 rename 取代，避免寫到一半時留下損毀的檔案"""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, path)
+    except:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindWriter(QObject):
+    """延遲合併寫入 (write-behind)
+
+    mark_dirty() 只標記狀態已變更；閒置 delay_ms 後才在 GUI 執行緒取一次快照，
+    再交給背景執行緒序列化並以原子方式寫檔。連續多次變更只會寫入一次。
+    """
+
+    def __init__(self, snapshot, delay_ms=500, parent=None):
+        super().__init__(parent)
+        # snapshot() 回傳 (檔案路徑, 可序列化資料)；回傳 None 表示略過
+        self.snapshot = snapshot
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.write_now)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending = []
+
+    def mark_dirty(self):
+        """標記需要寫入 (重新計時，合併連續變更)"""
+        self.timer.start()
+
+    def is_dirty(self):
+        return self.timer.isActive()
+
+    def write_now(self):
+        """立即取快照並交給背景執行緒寫入"""
+        self.timer.stop()
+        snap = self.snapshot()
+        if snap is None:
+            return
+        path, data = snap
+        self.pending = [f for f in self.pending if not f.done()]
+        self.pending.append(self.executor.submit(self.write_file, path, data))
+
+    def write_file(self, path, data):
+        try:
+            atomic_write_json(path, data)
+        except Exception as e:
+            print(f"Error writing {path}: {e}")
+
+    def flush(self):
+        """寫入尚未儲存的變更並等待背景寫入完成 (關閉視窗前呼叫)"""
+        if self.timer.isActive():
+            self.write_now()
+        for future in self.pending:
+            future.result()
+        self.pending = []
@@ -0,0 +1,149 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 為選用套件，缺少時批次抽選改用純 Python
+    np = None
+
+
+class AliasSampler:
+    """Walker/Vose 別名表加權抽樣 (建表 O(n)，每次抽選 O(1))"""
+
+    def __init__(self, weights=()):
+        self.rebuild(weights)
+
+    def rebuild(self, weights):
+        """依權重重建別名表 (僅在選項改變時呼叫)"""
+        weights = [max(0.0, float(w)) for w in weights]
+        total = sum(weights)
+        n = len(weights)
+        self.size = n if total > 0 else 0
+        self.prob = [1.0] * self.size
+        self.alias = list(range(self.size))
+        self._prob_array = None
+        self._alias_array = None
+        if not self.size:
+            return
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # 剩餘項目因浮點誤差可能略偏離 1，直接視為滿格
+        for i in large + small:
+            self.prob[i] = 1.0
+
+        if np is not None:
+            self._prob_array = np.asarray(self.prob, dtype=np.float64)
+            self._alias_array = np.asarray(self.alias, dtype=np.intp)
+
+    def __len__(self):
+        return self.size
+
+    def draw(self, rng=random):
+        """抽一次，回傳選項索引 (沒有可抽選項時回傳 -1)"""
+        if not self.size:
+            return -1
+        i = int(rng.random() * self.size)
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+    def draw_batch(self, count, seed=None):
+        """批次抽選 count 次，有 NumPy 時回傳索引陣列 (向量化)"""
+        if not self.size or count <= 0:
+            return np.empty(0, dtype=np.intp) if np is not None else []
+        if np is None:
+            rng = random.Random(seed) if seed is not None else random
+            return [self.draw(rng) for _ in range(count)]
+        rng = np.random.default_rng(seed)
+        columns = rng.integers(0, self.size, size=count)
+        coins = rng.random(count)
+        return np.where(coins < self._prob_array[columns], columns, self._alias_array[columns])
+
+
+class FenwickTree:
+    """Fenwick (Binary Indexed) Tree：單點更新、前綴和與依累積權重搜尋皆為 O(log n)
+
+    樹節點以差值累加更新，歸零後可能殘留 ±1e-15 的浮點誤差；
+    因此另外記錄正權重的數量，全部歸零時總和直接視為 0.0。
+    """
+
+    def __init__(self, weights=()):
+        self.weights = [float(w) for w in weights]
+        n = len(self.weights)
+        self.tree = [0.0] * (n + 1)
+        for i, w in enumerate(self.weights, 1):
+            self.tree[i] += w
+            parent = i + (i & -i)
+            if parent <= n:
+                self.tree[parent] += self.tree[i]
+        self.remaining = sum(1 for w in self.weights if w > 0)
+        self.total = self.prefix_sum(n) if self.remaining else 0.0
+
+    def __len__(self):
+        return len(self.weights)
+
+    def set_weight(self, index, weight):
+        """修改單一權重"""
+        old = self.weights[index]
+        delta = weight - old
+        self.weights[index] = weight
+        self.remaining += (weight > 0) - (old > 0)
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+        self.total = self.prefix_sum(len(self.weights)) if self.remaining else 0.0
+
+    def prefix_sum(self, index):
+        """weights[0:index] 的總和"""
+        total = 0.0
+        i = index
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, value):
+        """回傳累積權重首次超過 value 的索引，超出範圍時回傳 -1"""
+        n = len(self.weights)
+        if value < 0 or value >= self.total:
+            return -1
+        pos = 0
+        step = 1 << (n.bit_length() - 1) if n else 0
+        while step:
+            nxt = pos + step
+            if nxt <= n and self.tree[nxt] <= value:
+                pos = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        if pos >= n:
+            pos = n - 1
+        if self.weights[pos] <= 0:
+            # 浮點殘差讓搜尋落在已歸零的位置，改取最近的正權重選項
+            pos = self._nearest_positive(pos)
+        return pos
+
+    def _nearest_positive(self, index):
+        """index 前後最近一個權重為正的索引 (僅在浮點殘差時使用)"""
+        for i in range(index + 1, len(self.weights)):
+            if self.weights[i] > 0:
+                return i
+        for i in range(index - 1, -1, -1):
+            if self.weights[i] > 0:
+                return i
+        return -1
+
+    def draw(self, rng=random):
+        """依權重抽一次，回傳索引 (沒有可抽選項時回傳 -1)"""
+        if self.total <= 0:
+            return -1
+        return self.find(rng.random() * self.total)
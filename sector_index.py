@@ -0,0 +1,108 @@
+import bisect
+import random
+from itertools import accumulate
+
+from sampler import FenwickTree
+
+
+class SectorIndex:
+    """扇形索引 (累積角度邊界 + 二分搜尋)
+
+    抽中移除模式下改以 Fenwick Tree 維護權重，移除與查詢皆為 O(log n)。
+    """
+
+    def __init__(self, items=None):
+        self.rebuild(items or [])
+
+    def rebuild(self, items):
+        """依選項權重重建累積邊界 (僅在選項改變時呼叫)"""
+        self.weights = [item['weight'] for item in items]
+        self.tree = None
+        self.prefix_weights = list(accumulate(self.weights))
+        self.total_weight = self.prefix_weights[-1] if self.weights else 0
+        self._bounds = None
+
+    @property
+    def bounds(self):
+        """bounds[i] 為第 i 個扇形的結束角度 (逆時針, 0 ~ 360)"""
+        if self._bounds is None:
+            if self.tree is not None:
+                self.prefix_weights = list(accumulate(self.weights))
+            if self.total_weight > 0:
+                self._bounds = [w / self.total_weight * 360 for w in self.prefix_weights]
+            else:
+                self._bounds = []
+        return self._bounds
+
+    def __len__(self):
+        return len(self.weights)
+
+    def remove(self, index):
+        """將扇形權重歸零 (抽中移除)，O(log n)"""
+        if self.tree is None:
+            self.tree = FenwickTree(self.weights)
+        self.tree.set_weight(index, 0.0)
+        self.weights[index] = 0.0
+        self.total_weight = self.tree.total
+        self._bounds = None
+
+    def move_boundary(self, index, weight):
+        """調整相鄰兩扇形 (index, index+1) 的權重，總和不變，只需更新一個累積值 O(1)"""
+        combined = self.weights[index] + self.weights[index + 1]
+        self.weights[index] = weight
+        self.weights[index + 1] = combined - weight
+        before = self.prefix_weights[index - 1] if index > 0 else 0
+        self.prefix_weights[index] = before + weight
+        if self._bounds is not None and self.total_weight > 0:
+            self._bounds[index] = self.prefix_weights[index] / self.total_weight * 360
+
+    def nearest_bounds(self, angle):
+        """角度兩側最近的分隔線索引 (bounds 中的索引)"""
+        bounds = self.bounds
+        n = len(bounds)
+        if not n:
+            return []
+        i = bisect.bisect_left(bounds, angle % 360)
+        # bounds[n-1] = 360 與 0 度為同一條線
+        return sorted({i % n, (i - 1) % n})
+
+    def spaced_bounds(self, min_gap):
+        """間距至少 min_gap 度的分隔線索引 (依序挑選，重疊者略過)
+
+        以二分搜尋跳到下一條不重疊的分隔線，次數只與結果數量有關 (最多 360 / min_gap)。
+        """
+        bounds = self.bounds
+        result = []
+        i = 0
+        while i < len(bounds):
+            result.append(i)
+            i = bisect.bisect_left(bounds, bounds[i] + min_gap, i + 1)
+        return result
+
+    def index_at(self, angle):
+        """取得角度所在的扇形索引，找不到時回傳 -1"""
+        if self.total_weight <= 0 or angle < 0:
+            return -1
+        if self.tree is not None:
+            return self.tree.find(angle / 360 * self.total_weight)
+        bounds = self.bounds
+        i = bisect.bisect_right(bounds, angle)
+        return i if i < len(bounds) else -1
+
+    def draw(self, rng=random):
+        """依權重抽一次，回傳扇形索引 (O(log n))"""
+        if self.total_weight <= 0:
+            return -1
+        return self.index_at(rng.random() * 360)
+
+    def start_angle(self, index):
+        """扇形起始角度"""
+        if self.tree is not None:
+            return self.tree.prefix_sum(index) / self.total_weight * 360 if self.total_weight > 0 else 0.0
+        return self.bounds[index - 1] if index > 0 else 0.0
+
+    def span_angle(self, index):
+        """扇形角度大小"""
+        if self.total_weight <= 0:
+            return 0.0
+        return self.weights[index] / self.total_weight * 360
@@ -0,0 +1,107 @@
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QUrl
+from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+
+FINISH_CACHE_SIZE = 16 # 最多常駐的選項音效數量
+
+
+class FinishSoundCache:
+    """選項專屬結束音效的 LRU 快取 (以 SOUND/ 內的檔名為鍵，共用同一音效的選項共用一份)
+
+    混音模式：交給 AudioMixer 背景解碼並常駐記憶體。
+    否則：每個音效保留一個已設定來源的 QMediaPlayer，播放時不需重新開檔。
+    """
+
+    def __init__(self, assets, mixer=None, capacity=FINISH_CACHE_SIZE):
+        self.assets = assets
+        self.mixer = mixer
+        self.capacity = capacity
+        self.entries = OrderedDict()  # 檔名 -> 混音器音效名稱 或 (QMediaPlayer, QAudioOutput)
+        self.warmed_files = None
+
+    def load(self, sound_file):
+        """載入 (或取得已載入的) 音效，檔案不存在時回傳 None"""
+        entry = self.entries.get(sound_file)
+        if entry is not None:
+            self.entries.move_to_end(sound_file)
+            return entry
+        path = self.assets.path("SOUND", sound_file)
+        if path is None:
+            # 舊資料可能保存完整路徑
+            if not (os.path.isabs(sound_file) and os.path.exists(sound_file)):
+                return None
+            path = sound_file
+        if self.mixer is not None:
+            entry = f"item:{sound_file}"
+            self.mixer.load(entry, path)
+        else:
+            player = QMediaPlayer()
+            audio = QAudioOutput()
+            player.setAudioOutput(audio)
+            player.setSource(QUrl.fromLocalFile(path))
+            entry = (player, audio)
+        self.entries[sound_file] = entry
+        while len(self.entries) > self.capacity:
+            self.release(*self.entries.popitem(last=False))
+        return entry
+
+    def release(self, sound_file, entry):
+        if self.mixer is not None:
+            self.mixer.load(entry, None)
+        else:
+            player, audio = entry
+            player.stop()
+            player.setSource(QUrl())
+            player.deleteLater()
+            audio.deleteLater()
+
+    def warm(self, items):
+        """預先載入選項使用的音效 (依列表順序，最多 capacity 個)"""
+        files = []
+        seen = set()
+        for item in items:
+            sound_file = item.get('sound_file', "")
+            if sound_file and item.get('sound_enable', False) and sound_file not in seen:
+                seen.add(sound_file)
+                files.append(sound_file)
+                if len(files) >= self.capacity:
+                    break
+        if files == self.warmed_files:
+            return
+        self.warmed_files = files
+        for sound_file in files:
+            self.load(sound_file)
+
+    def play(self, sound_file):
+        """播放選項音效，回傳是否成功 (檔案不存在時回傳 False 改播預設音效)"""
+        entry = self.load(sound_file)
+        if entry is None:
+            return False
+        if self.mixer is not None:
+            return self.mixer.play(entry, tag="finish")
+        player = entry[0]
+        player.stop()
+        player.play()
+        return True
+
+    def stop(self):
+        if self.mixer is not None:
+            self.mixer.stop("finish")
+            return
+        for player, _ in self.entries.values():
+            player.stop()
+
+    def invalidate(self, sound_file):
+        """檔案內容已更換，下次重新載入"""
+        entry = self.entries.pop(sound_file, None)
+        if entry is not None:
+            self.release(sound_file, entry)
+        self.warmed_files = None
+
+    def clear(self):
+        """釋放全部 (匯入/刪除檔案前解除檔案鎖定)"""
+        while self.entries:
+            self.release(*self.entries.popitem(last=False))
+        self.warmed_files = None
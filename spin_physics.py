@@ -0,0 +1,68 @@
+import time
+
+
+class SpinPhysics:
+    """解析式旋轉物理：angle(t) = v0·t − ½·a·t²
+
+    角度只由經過時間決定，計時器抖動或掉幀不會改變停止位置與時間。
+    """
+    # 舊版物理以每 25ms 一個 tick 為單位 (度/tick, 度/tick²)
+    TICK_SECONDS = 0.025
+
+    def __init__(self):
+        self.start_angle = 0.0
+        self.velocity = 0.0       # 初速 (度/秒)
+        self.deceleration = 0.0   # 減速度 (度/秒²)
+        self.duration = 0.0       # 停止所需時間 (秒)
+        self.distance = 0.0       # 總旋轉角度 (未取模)
+        self.stop_angle = 0.0
+        self.start_time = None
+
+    @classmethod
+    def from_tick_units(cls, start_angle, speed_per_tick, decel_per_tick, start_time=None):
+        """以舊版 tick 單位 (度/tick) 建立物理模型"""
+        physics = cls()
+        physics.start(start_angle,
+                      speed_per_tick / cls.TICK_SECONDS,
+                      decel_per_tick / (cls.TICK_SECONDS ** 2),
+                      start_time)
+        return physics
+
+    def start(self, start_angle, velocity, deceleration, start_time=None):
+        """開始旋轉，並立即算出停止角度與停止時間"""
+        self.start_angle = start_angle
+        self.velocity = max(0.0, velocity)
+        self.deceleration = deceleration
+        if self.velocity > 0 and deceleration > 0:
+            self.duration = self.velocity / deceleration
+            self.distance = self.velocity * self.velocity / (2 * deceleration)
+        else:
+            self.duration = 0.0
+            self.distance = 0.0
+        self.stop_angle = (start_angle + self.distance) % 360
+        self.start_time = time.perf_counter() if start_time is None else start_time
+
+    def elapsed(self, now=None):
+        """自開始旋轉經過的秒數"""
+        if self.start_time is None:
+            return 0.0
+        if now is None:
+            now = time.perf_counter()
+        return now - self.start_time
+
+    def position_at(self, t):
+        """t 秒時已旋轉的總角度 (未取模)"""
+        t = min(max(t, 0.0), self.duration)
+        return self.velocity * t - 0.5 * self.deceleration * t * t
+
+    def angle_at(self, t):
+        """t 秒時的轉盤角度 (0 ~ 360)"""
+        return (self.start_angle + self.position_at(t)) % 360
+
+    def speed_at(self, t):
+        """t 秒時的角速度 (度/秒)"""
+        t = min(max(t, 0.0), self.duration)
+        return self.velocity - self.deceleration * t
+
+    def is_finished(self, t):
+        return t >= self.duration
@@ -0,0 +1,247 @@
+import json
+import math
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+from PySide6.QtCore import QObject, QProcess, Signal, Qt
+from PySide6.QtGui import QColor, QImage, QImageWriter
+from PySide6.QtWidgets import QWidget
+
+from utils import external_path
+
+RECORD_FPS = 30
+HOLD_SECONDS = 1.5 # 停止後保留結果畫面的秒數
+QUEUE_FRAMES = 8   # 編碼佇列上限 (渲染太快時等待編碼)
+
+# 依副檔名決定 ffmpeg 輸出參數
+FFMPEG_ARGS = {
+    ".mp4": ["-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2", "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18"],
+    ".webm": ["-c:v", "libvpx-vp9", "-pix_fmt", "yuva420p", "-b:v", "0", "-crf", "30"],
+    ".gif": ["-vf", "split[a][b];[a]palettegen=reserve_transparent=1[p];[b][p]paletteuse", "-loop", "0"],
+    ".webp": ["-c:v", "libwebp", "-q:v", "80", "-loop", "0"],
+}
+
+
+def find_ffmpeg():
+    """尋找 ffmpeg (PATH 或程式同層級)"""
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    for name in ("ffmpeg.exe", "ffmpeg"):
+        local = external_path(name)
+        if os.path.exists(local):
+            return local
+    return None
+
+
+def needs_ffmpeg(path):
+    return os.path.splitext(path)[1].lower() != ".png"
+
+
+def build_job(wheel_window, settings, output_path, fps=RECORD_FPS):
+    """將上一次轉動與轉盤設定轉為可序列化的錄製工作"""
+    spin = wheel_window.last_spin
+    if spin is None:
+        return None
+    style = [QColor(v).name(QColor.HexArgb) if isinstance(v, QColor) else v for v in settings['style']]
+    items = [{'name': item['name'], 'weight': weight, 'color': QColor(item['color']).name(QColor.HexArgb)}
+             for item, weight in zip(spin['items'], spin['weights'])]
+    return {
+        'output': output_path,
+        'fps': fps,
+        'size': [wheel_window.width(), wheel_window.height()],
+        'items': items,
+        'style': style,
+        'classic': list(settings['classic']),
+        'mode': list(settings['mode']),
+        'physics': spin['physics'],
+    }
+
+
+class PngSequenceEncoder:
+    """以 QImageWriter 輸出 PNG 序列 (保留透明背景)"""
+
+    def __init__(self, path, width, height, fps):
+        self.base = os.path.splitext(path)[0]
+        self.count = 0
+
+    def write(self, image):
+        writer = QImageWriter(f"{self.base}_{self.count:05d}.png", b"png")
+        if not writer.write(image):
+            raise IOError(writer.errorString())
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class FfmpegEncoder:
+    """將原始影格經由 pipe 交給 ffmpeg 編碼"""
+
+    def __init__(self, path, width, height, fps):
+        ffmpeg = find_ffmpeg()
+        if not ffmpeg:
+            raise IOError("找不到 ffmpeg")
+        ext = os.path.splitext(path)[1].lower()
+        # QImage ARGB32 在 little-endian 記憶體中為 BGRA
+        command = [ffmpeg, "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "bgra", "-s", f"{width}x{height}", "-r", str(fps),
+                   "-i", "-"] + FFMPEG_ARGS.get(ext, []) + [path]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, image):
+        # ffmpeg 的 bgra 為非預乘 alpha，預乘影格需先轉換，否則半透明邊緣會變暗
+        image = image.convertToFormat(QImage.Format_ARGB32)
+        self.process.stdin.write(bytes(image.constBits()))
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise IOError(f"ffmpeg 結束代碼 {self.process.returncode}")
+
+
+class EncoderThread(threading.Thread):
+    """編碼工作執行緒：渲染與編碼分開進行"""
+
+    def __init__(self, encoder):
+        super().__init__(daemon=True)
+        self.encoder = encoder
+        self.frames = queue.Queue(maxsize=QUEUE_FRAMES)
+        self.error = None
+
+    def run(self):
+        while True:
+            image = self.frames.get()
+            if image is None:
+                break
+            if self.error is None:
+                try:
+                    self.encoder.write(image)
+                except Exception as e:
+                    self.error = e
+        try:
+            self.encoder.close()
+        except Exception as e:
+            self.error = self.error or e
+
+    def put(self, image):
+        if self.error is not None:
+            raise self.error
+        self.frames.put(image)
+
+    def finish(self):
+        self.frames.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+
+
+def render_job(job, progress=None):
+    """以 WheelWindow 的繪圖程式逐格重播轉動 (不等待實際時間，比即時更快)"""
+    from wheel_window import WheelWindow
+    from spin_physics import SpinPhysics
+
+    width, height = job['size']
+    fps = job['fps']
+    items = [{'name': i['name'], 'weight': i['weight'], 'color': QColor(i['color'])} for i in job['items']]
+    style = [QColor(v) if isinstance(v, str) and v.startswith('#') else v for v in job['style']]
+
+    window = WheelWindow(render_only=True)
+    window.resize(width, height)
+    window.update_settings(items, *style)
+    window.set_classic_settings(*job['classic'])
+    window.set_mode(*job['mode'])
+    window.assets.wait() # 指針圖片於背景載入
+    window.show_resize_grip = False
+    window.grip_timer.stop()
+
+    physics = SpinPhysics()
+    start_angle, velocity, deceleration = job['physics']
+    physics.start(start_angle, velocity, deceleration, start_time=0.0)
+    spin_frames = max(1, math.ceil(physics.duration * fps)) + 1
+    hold_frames = math.ceil(HOLD_SECONDS * fps)
+    total = spin_frames + hold_frames
+
+    encoder_class = FfmpegEncoder if needs_ffmpeg(job['output']) else PngSequenceEncoder
+    encoder = EncoderThread(encoder_class(job['output'], width, height, fps))
+    encoder.start()
+    try:
+        for frame in range(total):
+            t = min(frame / fps, physics.duration)
+            window._rotation_angle = physics.angle_at(t)
+            if frame == spin_frames:
+                window.result_text = f"{window.winner_name()} "
+            image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+            window.render(image, renderFlags=QWidget.RenderFlag.DrawChildren)
+            encoder.put(image)
+            if progress:
+                progress(frame + 1, total)
+    finally:
+        encoder.finish()
+        window.deleteLater()
+
+
+def run_record_job(job_path):
+    """命令列進入點 (main.py --record job.json)，於 offscreen 平台執行"""
+    try:
+        with open(job_path, 'r', encoding='utf-8') as f:
+            job = json.load(f)
+        render_job(job, lambda done, total: print(f"PROGRESS {done} {total}", flush=True))
+    except Exception as e:
+        print(f"ERROR {e}", flush=True)
+        return 1
+    return 0
+
+
+class SpinRecordProcess(QObject):
+    """在獨立行程 (offscreen QPA) 中錄製，避免影響轉盤視窗"""
+    progress = Signal(int, int)
+    finished = Signal(bool, str)
+
+    def __init__(self, job, parent=None):
+        super().__init__(parent)
+        self.error = ""
+        fd, self.job_path = tempfile.mkstemp(suffix=".json", prefix="spin_record_")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+
+        self.process = QProcess(self)
+        env = self.process.processEnvironment()
+        if env.isEmpty():
+            from PySide6.QtCore import QProcessEnvironment
+            env = QProcessEnvironment.systemEnvironment()
+        env.insert("QT_QPA_PLATFORM", "offscreen")
+        self.process.setProcessEnvironment(env)
+        self.process.readyReadStandardOutput.connect(self.on_output)
+        self.process.finished.connect(self.on_finished)
+
+    def start(self):
+        if getattr(sys, 'frozen', False):
+            self.process.start(sys.executable, ["--record", self.job_path])
+        else:
+            main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+            self.process.start(sys.executable, [main_path, "--record", self.job_path])
+
+    def on_output(self):
+        while self.process.canReadLine():
+            line = bytes(self.process.readLine()).decode('utf-8', errors='replace').strip()
+            if line.startswith("PROGRESS "):
+                done, total = line.split()[1:3]
+                self.progress.emit(int(done), int(total))
+            elif line.startswith("ERROR "):
+                self.error = line[6:]
+
+    def on_finished(self, exit_code, exit_status):
+        self.on_output()
+        try:
+            os.remove(self.job_path)
+        except OSError:
+            pass
+        ok = exit_status == QProcess.NormalExit and exit_code == 0
+        self.finished.emit(ok, self.error)
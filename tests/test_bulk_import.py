@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from bulk_import import delimiter_for_path, parse_entries, MAX_WEIGHT, MIN_WEIGHT
+
+
+def test_name_list_keeps_commas_in_names():
+    entries, skipped, rejected = parse_entries("Smith, John\nDoe, Jane\n")
+    assert [e[0] for e in entries] == ["Smith, John", "Doe, Jane"]
+    assert all(e[1] == 1.0 for e in entries)
+    assert skipped == 0 and rejected == []
+
+
+def test_csv_reads_weight_and_color():
+    text = "name,weight,color\nA,2,#ff0000\nB,,\nC,99999,\n\"D, E\",0.01\n"
+    entries, skipped, rejected = parse_entries(text, delimiter=',')
+    assert entries == [
+        ("A", 2.0, "#ff0000"),
+        ("B", 1.0, None),
+        ("C", MAX_WEIGHT, None),
+        ("D, E", MIN_WEIGHT, None),
+    ]
+    assert rejected == []
+
+
+def test_unparseable_weights_are_rejected_not_defaulted():
+    entries, skipped, rejected = parse_entries("A,2\nB,abc\nC,nan\nD,3\n", delimiter=',')
+    assert [e[0] for e in entries] == ["A", "D"]
+    assert rejected == [(2, "abc"), (3, "nan")]
+
+
+def test_duplicates_are_skipped_against_existing_names():
+    entries, skipped, rejected = parse_entries("A\nB\nA\nC\n", existing_names={"C"})
+    assert [e[0] for e in entries] == ["A", "B"]
+    assert skipped == 2
+
+
+def test_delimiter_follows_extension():
+    assert delimiter_for_path("list.CSV") == ','
+    assert delimiter_for_path("sheet.tsv") == '\t'
+    assert delimiter_for_path("names.txt") is None
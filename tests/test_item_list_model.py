@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtGui import QColor
+
+from item_list_model import ItemListModel
+
+
+def make_items(names):
+    return [{'name': n, 'weight': 1.0, 'color': QColor("#ff0000"), 'enabled': True} for n in names]
+
+
+def test_appending_rows_keeps_session_removals():
+    items = make_items(["n0", "n1"])
+    model = ItemListModel()
+    model.set_items(items)
+    model.removed_items[id(items[0])] = items[0]
+    model.weights_changed()
+
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    items.extend(make_items(["n2", "n3"]))
+    model.items_appended(2)
+
+    assert inserted == [(2, 3)]
+    assert model.rowCount() == 4
+    assert not model.is_active(items[0])
+    assert model.total_weight == 3.0
+    assert model.probability(items[2]) == pytest.approx(100 / 3)
+
+
+def test_set_items_clears_session_removals():
+    items = make_items(["n0", "n1"])
+    model = ItemListModel()
+    model.set_items(items)
+    model.removed_items[id(items[0])] = items[0]
+    model.set_items(make_items(["a"]))
+    assert model.removed_items == {}
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+import sampler
+from sampler import AliasSampler, FenwickTree
+
+
+def test_alias_table_matches_weights_exactly():
+    weights = [1, 2, 3, 0, 4]
+    alias = AliasSampler(weights)
+    total = sum(weights)
+    # 每欄機率 1/n：自身 prob[i]，其餘歸 alias[i]
+    mass = [0.0] * len(weights)
+    for i in range(len(alias)):
+        mass[i] += alias.prob[i] / len(alias)
+        mass[alias.alias[i]] += (1.0 - alias.prob[i]) / len(alias)
+    assert mass == pytest.approx([w / total for w in weights])
+
+
+def test_alias_never_draws_zero_weight():
+    alias = AliasSampler([0, 5, 0, 1])
+    rng = random.Random(3)
+    assert {alias.draw(rng) for _ in range(2000)} == {1, 3}
+
+
+def test_alias_empty_or_all_zero():
+    for weights in ([], [0, 0]):
+        alias = AliasSampler(weights)
+        assert len(alias) == 0
+        assert alias.draw() == -1
+        assert len(alias.draw_batch(10)) == 0
+
+
+def test_draw_batch_is_seeded_and_in_range():
+    alias = AliasSampler([1, 1, 2])
+    first = list(alias.draw_batch(1000, seed=7))
+    assert first == list(alias.draw_batch(1000, seed=7))
+    assert set(first) <= {0, 1, 2}
+
+
+def test_draw_batch_without_numpy(monkeypatch):
+    monkeypatch.setattr(sampler, "np", None)
+    alias = AliasSampler([1, 0, 1])
+    draws = alias.draw_batch(500, seed=1)
+    assert isinstance(draws, list)
+    assert set(draws) == {0, 2}
+
+
+def test_fenwick_prefix_sum_and_find():
+    tree = FenwickTree([1, 2, 3, 4])
+    assert [tree.prefix_sum(i) for i in range(5)] == [0, 1, 3, 6, 10]
+    assert tree.find(0) == 0
+    assert tree.find(0.999) == 0
+    assert tree.find(1) == 1
+    assert tree.find(9.5) == 3
+    assert tree.find(10) == -1
+    assert tree.find(-0.1) == -1
+
+
+def test_fenwick_set_weight_skips_zeroed_slots():
+    tree = FenwickTree([1, 2, 3, 4])
+    tree.set_weight(1, 0.0)
+    assert tree.total == 8
+    assert tree.find(1) == 2
+    tree.set_weight(1, 5.0)
+    assert tree.total == 13
+    assert tree.find(1) == 1
+
+
+def test_fenwick_total_is_exactly_zero_after_draining():
+    rng = random.Random(0)
+    for _ in range(200):
+        weights = [rng.uniform(0.01, 10.0) for _ in range(rng.randint(1, 50))]
+        tree = FenwickTree(weights)
+        for i in rng.sample(range(len(weights)), len(weights)):
+            tree.set_weight(i, 0.0)
+        assert tree.total == 0.0
+        assert tree.draw(rng) == -1
@@ -0,0 +1,57 @@
+import random
+
+from sector_index import SectorIndex
+
+
+def make_items(weights):
+    return [{'name': f"item{i}", 'weight': w} for i, w in enumerate(weights)]
+
+
+def test_index_at_uses_prefix_bounds():
+    index = SectorIndex(make_items([1, 2, 1]))
+    assert index.bounds == [90.0, 270.0, 360.0]
+    assert index.index_at(0) == 0
+    assert index.index_at(90) == 1
+    assert index.index_at(359.9) == 2
+    assert index.index_at(360) == -1
+
+
+def test_remove_skips_removed_sectors():
+    index = SectorIndex(make_items([1, 2, 1]))
+    index.remove(1)
+    assert index.total_weight == 2
+    assert index.bounds == [180.0, 180.0, 360.0]
+    assert index.index_at(179) == 0
+    assert index.index_at(181) == 2
+    assert index.start_angle(2) == 180.0
+    assert index.span_angle(1) == 0.0
+
+
+def test_drain_draws_each_item_once_and_ends_at_zero():
+    rng = random.Random(1)
+    for _ in range(300):
+        weights = [rng.uniform(0.01, 10.0) for _ in range(rng.randint(1, 40))]
+        index = SectorIndex(make_items(weights))
+        drawn = []
+        while index.total_weight > 0:
+            i = index.draw(rng)
+            assert i != -1
+            assert index.weights[i] > 0
+            drawn.append(i)
+            index.remove(i)
+        assert sorted(drawn) == list(range(len(weights)))
+        assert index.total_weight == 0.0
+        assert index.draw(rng) == -1
+        assert index.index_at(0) == -1
+
+
+def test_rebuild_after_remove_restores_sectors():
+    items = make_items([1, 1, 1, 1])
+    index = SectorIndex(items)
+    index.remove(0)
+    assert index.index_at(45) == 1
+    index.rebuild(items)
+    assert index.weights == [1, 1, 1, 1]
+    assert index.total_weight == 4
+    assert index.index_at(45) == 0
+    assert index.span_angle(0) == 90.0
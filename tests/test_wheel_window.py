@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6.QtMultimedia", exc_type=ImportError)
+
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from wheel_window import WheelWindow
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_remove_then_restore_puts_sector_back(app):
+    items = [{'name': f"n{i}", 'weight': 1, 'color': QColor("#ff0000")} for i in range(4)]
+    window = WheelWindow(render_only=True)
+    window.update_settings(items, True, QColor("white"), QColor("white"), QColor("black"))
+    window.remove_item(0)
+    assert window.sector_index.index_at(45) == 1
+
+    # 設定視窗復原時傳入相同的選項，比對鍵不變
+    window.update_settings(items, True, QColor("white"), QColor("white"), QColor("black"))
+    window.restore_items()
+    assert window.sector_index.weights == [1, 1, 1, 1]
+    assert window.sector_index.index_at(45) == 0
+    assert window.sampler is None
+    window.deleteLater()
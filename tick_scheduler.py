@@ -0,0 +1,125 @@
+import bisect
+import math
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+MIN_TICK_INTERVAL = 0.015 # 滴答聲最短間隔 (秒)，更密集的跨越合併為一次
+LOOKAHEAD = 0.05          # 每影格預先規劃的時間範圍 (秒)，需大於影格間隔
+EDGE_EPSILON = 1e-9
+
+
+class TickScheduler(QObject):
+    """滴答聲排程
+
+    由物理曲線與扇形邊界解析計算指針跨越分隔線的時間，
+    一個影格內跨越多條分隔線也不會遺漏，並於精確的子影格時間發出 tick。
+    """
+    tick = Signal(int)
+
+    def __init__(self, parent=None, min_interval=MIN_TICK_INTERVAL):
+        super().__init__(parent)
+        self.min_interval = min_interval
+        self.physics = None
+        self.edges = []              # 分隔線位置 (沿指針行進方向，已排序)
+        self.pointer_start = 0.0     # 開始時指針在邊界座標中的位置
+        self.planned_position = 0.0  # 已規劃到的旋轉距離
+        self.last_tick_time = None
+        self.pending = deque()       # (時間, 頻率)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.fire)
+
+    def start(self, physics, bounds, pointer_angle, direction=1):
+        """開始排程
+
+        bounds 為各扇形結束角度 (SectorIndex.bounds)，pointer_angle 為開始時指針所指的轉盤角度，
+        direction 表示轉動時該角度增加 (1) 或減少 (-1)。
+        """
+        self.cancel()
+        edges = {b % 360 for b in bounds}
+        if len(edges) < 2:
+            # 只有一個扇形，不會跨越
+            return
+        if direction < 0:
+            # 反向時改用鏡像座標，讓指針位置一律隨旋轉距離增加
+            edges = {(-e) % 360 for e in edges}
+            pointer_angle = -pointer_angle
+        self.edges = sorted(edges)
+        self.pointer_start = pointer_angle % 360
+        self.physics = physics
+
+    def cancel(self):
+        self.physics = None
+        self.edges = []
+        self.planned_position = 0.0
+        self.last_tick_time = None
+        self.pending.clear()
+        self.timer.stop()
+
+    def next_crossing(self, position):
+        """旋轉距離 position 之後第一次跨越分隔線時的旋轉距離"""
+        x = (self.pointer_start + position) % 360
+        # 加上微小容差，避免浮點誤差讓指針停在剛跨越的分隔線上重複計算
+        i = bisect.bisect_right(self.edges, x + EDGE_EPSILON)
+        edge = self.edges[i] if i < len(self.edges) else self.edges[0] + 360
+        return position + (edge - x)
+
+    def time_at(self, position):
+        """旋轉距離達到 position 的時間 (position(t) 的反函數)"""
+        v = self.physics.velocity
+        a = self.physics.deceleration
+        if a <= 0:
+            return position / v if v > 0 else math.inf
+        return (v - math.sqrt(max(0.0, v * v - 2 * a * position))) / a
+
+    @staticmethod
+    def tick_frequency(interval):
+        """依滴答間隔換算音高 (越密集越高)"""
+        if interval is None:
+            return 400
+        ms_diff = max(1, interval * 1000)
+        return min(1500, max(200, 400 + int(8000 / ms_diff)))
+
+    def plan(self, t):
+        """規劃 t 到 t + LOOKAHEAD 之間的滴答 (每影格呼叫)"""
+        physics = self.physics
+        if physics is None:
+            return
+        end = physics.position_at(t + LOOKAHEAD)
+        position = self.planned_position
+        while True:
+            if self.last_tick_time is not None:
+                # 速率限制：與上次滴答間隔太短的跨越併入下一次
+                position = max(position, physics.position_at(self.last_tick_time + self.min_interval))
+            crossing = self.next_crossing(position)
+            if crossing > end:
+                break
+            tick_time = self.time_at(crossing)
+            interval = tick_time - self.last_tick_time if self.last_tick_time is not None else None
+            self.pending.append((tick_time, self.tick_frequency(interval)))
+            self.last_tick_time = tick_time
+            position = crossing
+        self.planned_position = end
+        if self.pending and not self.timer.isActive():
+            self.arm()
+
+    def arm(self):
+        due = self.physics.start_time + self.pending[0][0]
+        self.timer.start(max(0, math.ceil((due - time.perf_counter()) * 1000)))
+
+    def fire(self):
+        if self.physics is None:
+            return
+        now = time.perf_counter() - self.physics.start_time
+        freq = None
+        # 計時器延遲時，已到期的多個滴答只播放一次
+        while self.pending and self.pending[0][0] <= now + 0.001:
+            freq = self.pending.popleft()[1]
+        if freq is not None:
+            self.tick.emit(freq)
+        if self.pending:
+            self.arm()
@@ -1,23 +1,42 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QApplication, QMessageBox, QLabel, QListWidget, QListWidgetItem, QHBoxLayout, QFrame
-from PySide6.QtGui import QPainter, QBrush, QPen, QColor, QPainterPath, QFont, QPolygonF, QCursor, QTextOption, QMouseEvent, QPixmap, QTransform
+from PySide6.QtGui import QPainter, QBrush, QPen, QColor, QPainterPath, QFont, QPolygonF, QCursor, QTextOption, QMouseEvent, QPixmap, QTransform, QFontMetrics, QStaticText
 from PySide6.QtCore import Qt, QPointF, QRectF, QPropertyAnimation, QEasingCurve, Property, Signal, QRect, QTimer, QSize, QTime, QUrl
 from PySide6.QtMultimedia import QSoundEffect, QMediaPlayer, QAudioOutput, QAudioDevice
 import os
 import random
 import math
 from utils import resource_path, external_path
+from sector_index import SectorIndex
+from spin_physics import SpinPhysics
+from sampler import AliasSampler
+from tick_scheduler import TickScheduler
+from audio_mixer import AudioMixer
+from sound_cache import FinishSoundCache
+from asset_manager import AssetManager, ROOT, file_signature
 
 
 
 class WheelWindow(QWidget):
     """轉盤視窗Class"""
+    # 指針預先旋轉的角度格數 (0 = 每幀以變換矩陣旋轉縮放後的圖片)
+    POINTER_ROTATION_STEPS = 0
+    # 混音器滴答：音高換算基準 (見 TickScheduler.tick_frequency) 與同時發聲數量上限
+    TICK_BASE_FREQ = 600
+    TICK_MAX_VOICES = 6
+    # 細節層級：外緣弧長 (裝置像素) 小於此值的扇形不畫分隔線，並與相鄰細小扇形合併
+    LOD_SEPARATOR_PX = 4.0
+    LOD_MERGE_PX = 1.0
     spin_finished = Signal(str)
     weights_changed = Signal()
+    weights_previewed = Signal()
+    item_removed = Signal(int)
     window_closed = Signal()
 
-    def __init__(self, edit_mode=False):
+    def __init__(self, edit_mode=False, render_only=False):
         super().__init__()
         self.edit_mode = edit_mode
+        # 僅供離線錄製繪圖：不開啟音效輸出、不載入音效、不監看資產資料夾
+        self.render_only = render_only
         self.setWindowTitle("轉盤")
         self.resize(500, 600)
         
@@ -48,6 +67,9 @@ class WheelWindow(QWidget):
         self.is_previewing_opacity = False
         
         self.items = []
+        self.sector_index = SectorIndex()
+        self.sampler = None # 別名表，選項改變時清除並於下次抽選重建
+        self.remove_winners = False # 抽中移除模式
         self._rotation_angle = 0
         self.result_text = ""
         self.result_color = QColor(Qt.white)
@@ -63,33 +85,60 @@ class WheelWindow(QWidget):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.physics_update)
         self.is_spinning = False
-        self.rotation_speed = 0
-        self.deceleration = 0
+        self.physics = SpinPhysics()
         self.spin_speed_mult = 1.0
+        self.last_spin = None # 上一次轉動的初始狀態 (供錄製重播)
         
         self.old_pos = None
         self.drag_separator_index = -1
         self.hover_separator_index = -1
+        # 拖曳分隔線：拖曳中只在本視窗預覽，放開時才送出 weights_changed；
+        # 設定視窗的即時預覽最多每 100ms 一次
+        self.drag_weights_dirty = False
+        self.drag_preview_timer = QTimer(self)
+        self.drag_preview_timer.setSingleShot(True)
+        self.drag_preview_timer.setInterval(100)
+        self.drag_preview_timer.timeout.connect(self.weights_previewed.emit)
         self.setMouseTracking(True)
         self.is_dragging_window = False
         
-        self.last_pointer_index = -1
-        self.last_sound_time = QTime.currentTime()
+        # 滴答聲依物理曲線預先排程 (見 tick_scheduler.py)
+        self.tick_scheduler = TickScheduler(self)
+        self.tick_scheduler.tick.connect(self.play_tick_sound)
+        
+        # SOUND/ 與 PIC/ 索引 (檔案監看自動更新，圖片於背景載入)
+        self.assets = AssetManager(self, watch=not render_only)
+        self.assets.assets_changed.connect(self.on_assets_changed)
+        self.assets.image_loaded.connect(self.on_pointer_image_loaded)
+        self.sound_signatures = {} # 角色 -> (路徑, 檔案簽章)，未變更的音效不重新載入
         
         # Audio Initialization
-        self.tick_effect = QSoundEffect()
-        self.tick_player = QMediaPlayer()
-        self.tick_audio = QAudioOutput()
-        self.tick_player.setAudioOutput(self.tick_audio)
+        # 軟體混音器 (需要 NumPy)：滴答/循環/結束音效共用一個低延遲輸出；
+        # 無法使用時改用 QSoundEffect/QMediaPlayer
+        self.mixer = AudioMixer(self) if AudioMixer.available() and not render_only else None
+        if self.mixer is not None:
+            self.mixer.clip_failed.connect(lambda name, msg: self.on_audio_error(f"Mixer ({name})", "DecodeError", msg))
+        elif not render_only:
+            self.tick_effect = QSoundEffect()
+            self.tick_player = QMediaPlayer()
+            self.tick_audio = QAudioOutput()
+            self.tick_player.setAudioOutput(self.tick_audio)
+            
+            self.finish_player = QMediaPlayer()
+            self.finish_audio = QAudioOutput()
+            self.finish_player.setAudioOutput(self.finish_audio)
+            
+            self.loop_player = QMediaPlayer()
+            self.loop_audio = QAudioOutput()
+            self.loop_player.setAudioOutput(self.loop_audio)
+            
+            # Connect Error Signals (Add logging)
+            # 只連接一次 (load_sounds 會隨檔案監看重複呼叫)；錯誤訊息取自訊號本身
+            self.finish_player.errorOccurred.connect(lambda error, error_string: self.on_audio_error("FinishPlayer", error, error_string))
+            self.loop_player.errorOccurred.connect(lambda error, error_string: self.on_audio_error("LoopPlayer", error, error_string))
         self.using_mp3_tick = False # Flag for MP3 mode
-        
-        self.finish_player = QMediaPlayer()
-        self.finish_audio = QAudioOutput()
-        self.finish_player.setAudioOutput(self.finish_audio)
-        
-        self.loop_player = QMediaPlayer()
-        self.loop_audio = QAudioOutput()
-        self.loop_player.setAudioOutput(self.loop_audio)
+        # 選項專屬結束音效：選項載入時預先載入，停止時立即播放
+        self.finish_sounds = FinishSoundCache(self.assets, self.mixer)
         
         self.load_sounds()
 
@@ -107,13 +156,30 @@ class WheelWindow(QWidget):
         # UI Setup
         # self.setup_ui() # This line was part of the user's snippet but seems to be a typo/incomplete. Assuming it's not intended to be called here.
         self.pointer_image_path = ""
+        self.requested_pointer_path = None # 設定中的路徑 (載入失敗時 pointer_image_path 會改為預設圖片)
         self.pointer_pixmap = None
+        # 指針縮放快取 (原圖 cacheKey, 寬, 高) 與預先旋轉的圖片
+        self.pointer_cache = None
+        self.pointer_cache_key = None
+        self.pointer_rotation_cache = {}
+        self.last_pointer_region = None # 圖片模式上一幀指針範圍 (局部重繪用)
         self.pointer_angle_offset = 0
         self.pointer_scale = 1.0
         self.spin_speed_multiplier = 1.0 # 速度倍率
         self.classic_pointer_angle = 0
         self.center_text = "GO"
 
+        # 靜態轉盤圖層 (扇形/分隔線/邊框/文字 預先繪製，每幀只做旋轉貼圖)
+        self.wheel_layer = None
+        self.wheel_layer_radius = 0
+        self.wheel_layer_dpr = 1.0
+        self.wheel_layer_signature = None
+        # 文字排版快取 (名稱/角度/半徑/字型 -> 換行、字型大小、QStaticText)
+        self.label_layout_cache = {}
+        self.label_layouts_in_use = {}
+        # 上次由設定視窗套用的設定快照 (見 apply_settings)
+        self.applied_settings = {}
+
     def set_classic_settings(self, angle, text):
         """設定經典模式參數"""
         self.classic_pointer_angle = angle
@@ -121,14 +187,70 @@ class WheelWindow(QWidget):
         self.update()
 
     def set_mode(self, mode, image_path, angle_offset, scale=1.0):
-        """設定轉盤模式"""
+        """設定轉盤模式 (指針圖片路徑改變時才從磁碟重新載入)"""
         self.wheel_mode = mode
-        self.pointer_image_path = image_path
         self.pointer_angle_offset = angle_offset
         self.pointer_scale = scale
-        self.load_pointer_image()
+        if image_path != self.requested_pointer_path or self.pointer_pixmap is None:
+            self.requested_pointer_path = image_path
+            self.pointer_image_path = image_path
+            self.load_pointer_image()
+        elif self.pointer_image_path != image_path:
+            # 沿用預設圖片時也沿用預設校正角度
+            self.pointer_angle_offset = 335
         self.update()
 
+    def scaled_pointer(self, target_w, target_h):
+        """依目標大小與 devicePixelRatio 預先縮放的指針圖片 (大小或校正改變時才重建)"""
+        dpr = self.devicePixelRatioF()
+        width = max(1, round(target_w * dpr))
+        height = max(1, round(target_h * dpr))
+        key = (self.pointer_pixmap.cacheKey(), width, height)
+        if key != self.pointer_cache_key:
+            scaled = self.pointer_pixmap.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            scaled.setDevicePixelRatio(dpr)
+            self.pointer_cache = scaled
+            self.pointer_cache_key = key
+            self.pointer_rotation_cache = {}
+        return self.pointer_cache
+
+    def rotated_pointer(self, pointer, angle):
+        """預先旋轉的指針 (每 360 / POINTER_ROTATION_STEPS 度一張，用到時才建立)"""
+        steps = self.POINTER_ROTATION_STEPS
+        step = round(angle / 360 * steps) % steps
+        rotated = self.pointer_rotation_cache.get(step)
+        if rotated is None:
+            rotated = pointer.transformed(QTransform().rotate(step * 360 / steps), Qt.SmoothTransformation)
+            rotated.setDevicePixelRatio(pointer.devicePixelRatio())
+            self.pointer_rotation_cache[step] = rotated
+        return rotated
+
+    def apply_settings(self, items, settings):
+        """套用設定快照，只處理與上次不同的部分
+
+        settings 為 ConfigWindow.wheel_settings() 的結果：
+        style / classic / mode / remove_winners / window_mode / speed
+        """
+        previous = self.applied_settings
+        self.applied_settings = dict(settings)
+        # 選項本身在原地修改，無法以快照比對；update_settings 內部已比對靜態圖層
+        self.update_settings(items, *settings['style'])
+        if previous.get('classic') != settings['classic']:
+            self.set_classic_settings(*settings['classic'])
+        if previous.get('mode') != settings['mode']:
+            self.set_mode(*settings['mode'])
+        if previous.get('remove_winners') != settings['remove_winners']:
+            self.set_remove_winners(settings['remove_winners'])
+        if previous.get('window_mode') != settings['window_mode']:
+            # setWindowFlags 會重建原生視窗，只在模式真的改變時呼叫
+            self.set_window_mode(settings['window_mode'])
+        # 同步速度 (僅在未旋轉時更新，避免影響目前物理運算)
+        if not self.is_spinning:
+            self.spin_speed_multiplier = settings['speed']
+        elif previous.get('speed') != settings['speed']:
+            # 旋轉中無法套用，下次再比對
+            self.applied_settings['speed'] = previous.get('speed')
+
     def on_position_changed(self):
         """當視窗位置改變時觸發"""
         pass
@@ -158,23 +280,36 @@ class WheelWindow(QWidget):
                 pass
 
     def load_pointer_image(self):
-        """載入指針圖片"""
-        loaded = False
-        if self.pointer_image_path and os.path.exists(self.pointer_image_path):
-            self.pointer_pixmap = QPixmap(self.pointer_image_path)
-            if not self.pointer_pixmap.isNull():
-                loaded = True
-        
-        if not loaded:
-            # Fallback to default
-            default_path = resource_path(os.path.join("PIC", "ee.png"))
-            if os.path.exists(default_path):
-                self.pointer_pixmap = QPixmap(default_path)
-                self.pointer_image_path = default_path # Update path ref
-                # Default calibration for ee.png
-                self.pointer_angle_offset = 335
-            else:
-                self.pointer_pixmap = None
+        """載入指針圖片 (背景執行緒讀檔，完成前沿用目前的圖片)"""
+        if not self.pointer_image_path:
+            self.load_default_pointer()
+            return
+        image = self.assets.request_image(self.pointer_image_path)
+        if image is not None:
+            self.set_pointer_image(image)
+
+    def on_pointer_image_loaded(self, path, image):
+        if path != self.pointer_image_path:
+            return
+        if image.isNull():
+            self.load_default_pointer()
+        else:
+            self.set_pointer_image(image)
+        self.update()
+
+    def set_pointer_image(self, image):
+        self.pointer_pixmap = QPixmap.fromImage(image)
+
+    def load_default_pointer(self):
+        # Fallback to default
+        default_path = resource_path(os.path.join("PIC", "ee.png"))
+        if os.path.exists(default_path):
+            self.pointer_pixmap = QPixmap(default_path)
+            self.pointer_image_path = default_path # Update path ref
+            # Default calibration for ee.png
+            self.pointer_angle_offset = 335
+        else:
+            self.pointer_pixmap = None
 
     def set_window_mode(self, mode):
         """設定視窗模式"""
@@ -199,6 +334,21 @@ class WheelWindow(QWidget):
 
     def load_sounds(self):
         """載入音效資源 (支援 mp3/wav)"""
+        if self.render_only:
+            return
+        if self.finish_sound_enabled:
+            self.finish_sounds.warm(self.items)
+        if self.mixer is not None:
+            # 解碼一次後常駐記憶體，不佔用檔案；檔案未變更的音效不重新解碼
+            self.default_finish_path = self.find_audio_file("finish")
+            for role in ("tick", "finish", "loop"):
+                path = self.default_finish_path if role == "finish" else self.find_audio_file(role)
+                signature = (path, file_signature(path) if path else None)
+                if self.sound_signatures.get(role) != signature:
+                    self.sound_signatures[role] = signature
+                    self.mixer.load(role, path)
+            return
+
         # Tick Sound
         tick_path = self.find_audio_file("tick")
         self.using_mp3_tick = False
@@ -221,10 +371,6 @@ class WheelWindow(QWidget):
         if finish_path:
             self.finish_player.setSource(QUrl.fromLocalFile(finish_path))
             self.finish_audio.setVolume(1.0)
-            
-        # Connect Error Signals (Add logging)
-        self.finish_player.errorOccurred.connect(lambda error, msg=self.finish_player.errorString(): self.on_audio_error("FinishPlayer", error, msg))
-        self.loop_player.errorOccurred.connect(lambda error, msg=self.loop_player.errorString(): self.on_audio_error("LoopPlayer", error, msg))
 
         # Loop Sound
         loop_path = self.find_audio_file("loop")
@@ -235,6 +381,12 @@ class WheelWindow(QWidget):
 
     def release_audio_locks(self):
         """釋放所有音效檔案鎖定 (用於匯入/刪除時)"""
+        if self.render_only:
+            return
+        if self.mixer is not None:
+            # 混音器的音效已在記憶體中，不佔用檔案，也不需中斷播放
+            return
+        self.finish_sounds.clear()
         self.tick_effect.stop()
         self.tick_effect.setSource(QUrl())
         self.tick_player.stop()
@@ -248,20 +400,20 @@ class WheelWindow(QWidget):
 
     def find_audio_file(self, basename):
         """搜尋音效檔案 (優先 SOUND 資料夾, 其次根目錄; 優先 mp3, 其次 wav)"""
-        # 1. Check SOUND folder
-        sound_dir_base = os.path.join("SOUND", basename)
-        for ext in [".mp3", ".wav"]:
-            path = external_path(sound_dir_base + ext)
-            if os.path.exists(path):
-                return path
-                
-        # 2. Check Root folder (Legacy)
-        for ext in [".mp3", ".wav"]:
-            path = external_path(basename + ext)
-            if os.path.exists(path):
-                return path
-        return None
-        
+        return self.assets.find_audio(basename)
+
+    def on_assets_changed(self, folder, names):
+        """SOUND/、PIC/ 或根目錄的檔案有變動 (匯入或外部替換)"""
+        if folder == "PIC" and self.requested_pointer_path:
+            changed = {os.path.normcase(external_path(os.path.join(folder, n))) for n in names}
+            if os.path.normcase(os.path.normpath(self.requested_pointer_path)) in changed:
+                self.pointer_image_path = self.requested_pointer_path
+                self.load_pointer_image()
+        elif folder in ("SOUND", ROOT):
+            for name in names:
+                self.finish_sounds.invalidate(name)
+            self.load_sounds()
+
     def preview_opacity(self):
         """預覽透明度"""
         self.is_previewing_opacity = True
@@ -295,6 +447,12 @@ class WheelWindow(QWidget):
 
     def update_settings(self, items, border_enabled, border_color, result_color, result_bg_color, separator_enabled=True, sound_enabled=False, finish_sound_enabled=False, result_opacity=150, show_pointer_line=True, continuous_sound_enabled=False):
         """更新轉盤設定"""
+        signature = self.wheel_layer_key(items, border_enabled, border_color, separator_enabled)
+        if signature != self.wheel_layer_signature:
+            self.wheel_layer_signature = signature
+            self.invalidate_wheel_layer()
+            self.sector_index.rebuild(items)
+            self.sampler = None
         self.items = items
         self.border_enabled = border_enabled
         self.border_color = border_color
@@ -304,64 +462,116 @@ class WheelWindow(QWidget):
         self.sound_enabled = sound_enabled
         self.continuous_sound_enabled = continuous_sound_enabled
         if not self.continuous_sound_enabled:
-            self.loop_player.stop()
+            self.stop_loop_sound()
         self.finish_sound_enabled = finish_sound_enabled
+        if finish_sound_enabled and not self.render_only:
+            self.finish_sounds.warm(items)
         self.result_opacity = result_opacity
         self.show_pointer_line = show_pointer_line
         self.update()
 
+    def wheel_layer_key(self, items, border_enabled, border_color, separator_enabled):
+        """產生靜態圖層的比對鍵 (選項、顏色或線條設定改變時才需重建)"""
+        item_key = tuple((item['name'], item['weight'], QColor(item['color']).rgba()) for item in items)
+        return (item_key, border_enabled, QColor(border_color).rgba(), separator_enabled)
+
+    def invalidate_wheel_layer(self):
+        """標記靜態轉盤圖層需要重建"""
+        self.wheel_layer = None
+
+    def wheel_geometry(self):
+        """計算轉盤中心與半徑"""
+        rect = self.rect()
+        w = min(rect.width(), rect.height())
+        wheel_rect = QRectF((rect.width() - w)/2, 0, w, w)
+        return wheel_rect.center(), w / 2 - 25
+
+    def build_wheel_layer(self, radius):
+        """預先繪製靜態轉盤圖層 (依 devicePixelRatio 建立高解析度 Pixmap)"""
+        dpr = self.devicePixelRatioF()
+        # 邊框畫在 radius + 2 且筆寬 4，預留邊界避免被裁切
+        size = max(1, math.ceil((radius + 6) * 2 * dpr))
+        layer = QPixmap(size, size)
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.transparent)
+        
+        side = size / dpr
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.label_layouts_in_use = {}
+        self.draw_wheel(painter, QPointF(side / 2, side / 2), radius)
+        painter.end()
+        # 只保留本次用到的排版，名稱/角度/半徑改變的舊項目一併丟棄
+        self.label_layout_cache = self.label_layouts_in_use
+        
+        self.wheel_layer = layer
+        self.wheel_layer_radius = radius
+        self.wheel_layer_dpr = dpr
+
+    def draw_wheel_layer(self, painter, center, radius, start_angle):
+        """以旋轉變換繪製靜態轉盤圖層"""
+        if (self.wheel_layer is None or self.wheel_layer_radius != radius
+                or self.wheel_layer_dpr != self.devicePixelRatioF()):
+            self.build_wheel_layer(radius)
+        
+        side = self.wheel_layer.width() / self.wheel_layer.devicePixelRatio()
+        if start_angle == 0:
+            # 圖片模式背景固定不動：直接貼圖，不經過旋轉與平滑取樣
+            painter.drawPixmap(QPointF(center.x() - side / 2, center.y() - side / 2), self.wheel_layer)
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.translate(center)
+        # drawPie 角度為逆時針，Qt rotate 為順時針，因此取負號
+        painter.rotate(-start_angle)
+        painter.drawPixmap(QRectF(-side / 2, -side / 2, side, side), self.wheel_layer, QRectF(self.wheel_layer.rect()))
+        painter.restore()
+
     def set_rotation_angle(self, angle):
-        """設定旋轉角度並處理音效"""
+        """設定旋轉角度並重繪"""
         self._rotation_angle = angle
-        
-        if self.sound_enabled and not self.continuous_sound_enabled:
-            # 計算相對於轉盤的有效指針角度
-            if self.wheel_mode == "image":
-                # 圖片模式：統一邏輯：指針角度 = (90 + 旋轉角度 + 偏移量) % 360
-                # 基準 90 (北方) 確保預設指向頂部。
-                effective_angle = (90 + angle + self.pointer_angle_offset) % 360
-            else:
-                # 經典模式：轉盤旋轉。
-                # 有效角度 = (指針角度 - 旋轉角度) % 360
-                effective_angle = (self.classic_pointer_angle - angle) % 360
-                
-            total_weight = sum(item['weight'] for item in self.items)
-            if total_weight > 0:
-                current_angle_iter = 0
-                found_index = -1
-                for i, item in enumerate(self.items):
-                    span = (item['weight'] / total_weight) * 360
-                    if current_angle_iter <= effective_angle < current_angle_iter + span:
-                        found_index = i
-                        break
-                    current_angle_iter += span
-                    
-                if found_index != -1 and found_index != self.last_pointer_index:
-                    if self.last_pointer_index != -1:
-                        current_time = QTime.currentTime()
-                        ms_diff = self.last_sound_time.msecsTo(current_time)
-                        self.last_sound_time = current_time
-                        
-                        if ms_diff < 1:
-                            ms_diff = 1
-                        
-                        freq = 400 + int(8000 / ms_diff)
-                        if freq > 1500:
-                            freq = 1500
-                        if freq < 200:
-                            freq = 200
-                        
-                        self.play_tick_sound(freq)
-                    else:
-                        self.last_sound_time = QTime.currentTime()
-                        
-                    self.last_pointer_index = found_index
-        self.update()
+        if self.wheel_mode == "image" and not self.edit_mode and self.pointer_pixmap:
+            # 圖片模式只有指針在動：只重繪指針前後位置的範圍
+            region = self.pointer_region()
+            if self.last_pointer_region is not None:
+                self.update(self.last_pointer_region)
+            self.update(region)
+            self.last_pointer_region = region
+        else:
+            self.update()
+
+    def pointer_target_size(self, radius):
+        """圖片指針的顯示大小 (寬, 高)"""
+        target_h = radius * 1.0 * getattr(self, 'pointer_scale', 1.0)
+        target_w = target_h * (self.pointer_pixmap.width() / self.pointer_pixmap.height())
+        return target_w, target_h
+
+    def pointer_region(self):
+        """圖片指針 (含邏輯線) 目前所佔的視窗範圍"""
+        center, radius = self.wheel_geometry()
+        target_w, target_h = self.pointer_target_size(radius)
+        image_angle = (90 + self._rotation_angle + self.pointer_angle_offset) % 360
+        transform = QTransform()
+        transform.translate(center.x(), center.y())
+        transform.rotate(90 - image_angle)
+        bounds = transform.mapRect(QRectF(-target_w/2, -target_h/2, target_w, target_h))
+        if getattr(self, 'show_pointer_line', True):
+            rad = math.radians((90 + self._rotation_angle) % 360)
+            end = QPointF(center.x() + radius * math.cos(rad), center.y() - radius * math.sin(rad))
+            bounds = bounds.united(QRectF(center, end).normalized())
+        # 預留線寬與抗鋸齒的邊緣
+        return bounds.toAlignedRect().adjusted(-4, -4, 4, 4)
 
     def play_tick_sound(self, freq=600):
-        """播放滴答音效"""
+        """播放滴答音效 (freq 越高表示滴答越密集)"""
+        if self.render_only:
+            return
         if self.sound_enabled:
-             if self.using_mp3_tick:
+             if self.mixer is not None:
+                 # 重疊的滴答直接混音，不需要停止再播放
+                 pitch = min(max((freq / self.TICK_BASE_FREQ) ** 0.25, 0.75), 1.3)
+                 self.mixer.play("tick", pitch=pitch, max_voices=self.TICK_MAX_VOICES)
+             elif self.using_mp3_tick:
                  if self.tick_player.source().isValid():
                      if self.tick_player.playbackState() == QMediaPlayer.PlayingState:
                          self.tick_player.stop()
@@ -373,26 +583,102 @@ class WheelWindow(QWidget):
                  else:
                      pass
 
-    def play_finish_sound(self, custom_path=None):
-        """播放結束音效 (支援自訂路徑)"""
+    def start_loop_sound(self):
+        if self.render_only:
+            return
+        if self.mixer is not None:
+            if not self.mixer.is_playing("loop"):
+                self.mixer.play("loop", loop=True)
+        elif self.loop_player.source().isValid():
+            self.loop_player.play()
+
+    def stop_loop_sound(self):
+        if self.render_only:
+            return
+        if self.mixer is not None:
+            self.mixer.stop("loop")
+        else:
+            self.loop_player.stop()
+
+    def play_finish_sound(self, sound_file=None):
+        """播放結束音效 (sound_file 為選項專屬音效，不存在時使用預設音效)"""
+        if self.render_only:
+            return
     
         if not self.finish_sound_enabled:
             return
 
-        target_path = custom_path
-        
-        # 如果沒有自訂音效，使用預設音效
-        if not target_path:
-            target_path = getattr(self, 'default_finish_path', None)
-            
         # 強制停止循環音效 (確保切斷)
-        self.loop_player.stop()
+        self.stop_loop_sound()
             
-        if target_path and os.path.exists(target_path):
+        self.finish_sounds.stop()
+        if self.mixer is None:
             self.finish_player.stop()
-            self.finish_player.setSource(QUrl.fromLocalFile(target_path))
+
+        if sound_file and self.finish_sounds.play(sound_file):
+            return
+        if self.mixer is not None:
+            self.mixer.play("finish")
+        elif self.default_finish_path and self.finish_player.source().isValid():
             self.finish_player.play()
 
+    def set_remove_winners(self, enabled):
+        """設定抽中移除模式"""
+        self.remove_winners = enabled
+
+    def remove_item(self, index):
+        """將選項移出轉盤 (抽中移除)，只更新權重樹與靜態圖層
+
+        移除後總權重改變，其餘扇形的角度都會重新縮放，無法只重繪相鄰區域；
+        圖層於下次繪製時才重建，同一輪事件中的多次移除 (即時連抽) 只重建一次。
+        """
+        self.sector_index.remove(index)
+        self.sampler = None
+        self.invalidate_wheel_layer()
+        self.update()
+        self.item_removed.emit(index)
+
+    def restore_items(self):
+        """將抽中移除的選項放回轉盤 (self.items 未變，依原權重重建索引、抽樣器與圖層)"""
+        self.sector_index.rebuild(self.items)
+        self.sampler = None
+        self.invalidate_wheel_layer()
+        self.update()
+
+    def instant_spin(self, count):
+        """即時抽選 (不播放動畫)，回傳依序抽出的選項名稱"""
+        if self.is_spinning or count <= 0 or self.sector_index.total_weight <= 0:
+            return []
+        if self.remove_winners:
+            # 不放回抽選：每次抽中後立即移除，直到抽完或沒有剩餘選項
+            names = []
+            for _ in range(count):
+                if self.sector_index.total_weight <= 0:
+                    break
+                index = self.sector_index.draw()
+                if index == -1:
+                    break
+                names.append(self.items[index]['name'])
+                self.remove_item(index)
+        else:
+            # 以別名表加權抽選，機率與轉盤扇形大小一致
+            indices = self.winner_sampler().draw_batch(count)
+            if not isinstance(indices, list):
+                indices = indices.tolist()
+            names = [self.items[i]['name'] for i in indices]
+        if not names:
+            return names
+        self.result_text = f"{names[-1]} "
+        self.update()
+        self.result_timer.start()
+        return names
+
+    def winner_sampler(self):
+        """取得目前選項的別名表抽樣器 (必要時重建)"""
+        if self.sampler is None:
+            self.sampler = AliasSampler(item['weight'] for item in self.items)
+        return self.sampler
+
     def auto_spin(self, speed_multiplier=1.0):
         """自動旋轉（用於連抽）"""
         if self.is_spinning:
@@ -401,11 +687,16 @@ class WheelWindow(QWidget):
 
     def start_spin(self, speed_multiplier=1.0):
         """開始旋轉"""
-        self.result_text = ""
+        if self.sector_index.total_weight <= 0:
+            return
+        if self.result_text:
+            # 圖片模式旋轉中只重繪指針範圍，結果框需在此整窗清除一次
+            self.result_text = ""
+            self.update()
         self.spin_speed_mult = speed_multiplier
         # 應用使用者設定的旋轉速度倍率
         base_speed = random.uniform(20.0, 35.0)
-        self.rotation_speed = base_speed * speed_multiplier * self.spin_speed_multiplier
+        rotation_speed = base_speed * speed_multiplier * self.spin_speed_multiplier
         # 減速邏輯讓「轉速越快，持續時間越短」
         # 如果倍率 > 1 (快)，我們希望它更快停止 -> 更高的減速率。
         # 如果倍率 < 1 (慢)，我們希望它轉得更久/更慢 -> 更低的減速率。 
@@ -416,13 +707,27 @@ class WheelWindow(QWidget):
         
         # 依倍率平方縮放減速率，有效縮短較高速度下的旋轉時間。
         total_multiplier = speed_multiplier * self.spin_speed_multiplier
-        self.deceleration = base_decel * (total_multiplier ** 2.0)
+        deceleration = base_decel * (total_multiplier ** 2.0)
         
+        # 停止角度與停止時間在此即已確定，之後每幀只是依經過時間取樣
+        self.physics = SpinPhysics.from_tick_units(self._rotation_angle, rotation_speed, deceleration)
+        self.last_spin = {
+            'items': list(self.items),
+            'weights': list(self.sector_index.weights),
+            'physics': [self.physics.start_angle, self.physics.velocity, self.physics.deceleration],
+        }
         self.is_spinning = True
         
+        if self.sound_enabled and not self.continuous_sound_enabled:
+            # 圖片模式指針角度隨旋轉增加，經典模式則減少 (見 pointer_angle)
+            direction = 1 if self.wheel_mode == "image" else -1
+            self.tick_scheduler.start(self.physics, self.sector_index.bounds,
+                                      self.pointer_angle(self._rotation_angle), direction)
+        else:
+            self.tick_scheduler.cancel()
+        
         if self.continuous_sound_enabled:
-            if self.loop_player.source().isValid():
-                self.loop_player.play()
+            self.start_loop_sound()
                 
         self.timer.start(25)
 
@@ -432,255 +737,338 @@ class WheelWindow(QWidget):
             self.timer.stop()
             return
 
-        new_angle = self._rotation_angle + self.rotation_speed
-        self.set_rotation_angle(new_angle % 360)
-        
-        self.rotation_speed -= self.deceleration
+        t = self.physics.elapsed()
+        self.set_rotation_angle(self.physics.angle_at(t))
+        if self.sound_enabled:
+            self.tick_scheduler.plan(t)
         
-        if self.rotation_speed <= 0:
-            self.rotation_speed = 0
+        if self.physics.is_finished(t):
             self.is_spinning = False
             self.timer.stop()
             
             if self.continuous_sound_enabled:
-                self.loop_player.stop()
+                self.stop_loop_sound()
                     
             self.on_spin_finished()
 
-    def on_spin_finished(self):
-        """旋轉結束處理"""
-        final_angle = self._rotation_angle
+    def pointer_angle(self, rotation_angle):
+        """指針 (邏輯線) 所指的轉盤角度"""
         if self.wheel_mode == "image":
              # 圖片模式：統一邏輯 (90 為基準)。
              # 邏輯線 (獲勝者) 是純旋轉。偏移量僅影響圖片視覺。
-             effective_angle = (90 + final_angle) % 360
+             return (90 + rotation_angle) % 360
         else:
              # 經典模式
              # classic_pointer_angle 是順時針 (Visual)，轉為逆時針 (Qt) 需要負號
-             effective_angle = (-self.classic_pointer_angle - final_angle) % 360
-        
-        current_angle = 0
-        total_weight = sum(item['weight'] for item in self.items)
-        
-        winner_name = ""
-        for item in self.items:
-            span_angle = (item['weight'] / total_weight) * 360
-            
-            # Check range
-            if current_angle <= effective_angle < current_angle + span_angle:
-                winner_name = item['name']
-                break
-            current_angle += span_angle
-            
+             return (-self.classic_pointer_angle - rotation_angle) % 360
+
+    def winner_index(self):
+        """指針所指的選項索引"""
+        return self.sector_index.index_at(self.pointer_angle(self._rotation_angle))
+
+    def winner_name(self):
+        index = self.winner_index()
+        return self.items[index]['name'] if index != -1 else ""
+
+    def on_spin_finished(self):
+        """旋轉結束處理"""
+        winner_index = self.winner_index()
+        winner_item = self.items[winner_index] if winner_index != -1 else None
+        winner_name = winner_item['name'] if winner_item else ""
             
         print(f"WH: {winner_name}")
         self.result_text = f"{winner_name} "
         self.update()
         self.spin_finished.emit(winner_name)
+        if self.remove_winners and winner_index != -1:
+            self.remove_item(winner_index)
         
-        # 檢查是否有選項專屬音效
-        custom_sound_path = None
-        winner_item = next((i for i in self.items if i['name'] == winner_name), None)
+        # 選項專屬音效 (已預先載入)
+        sound_file = None
         if winner_item and winner_item.get('sound_enable', False):
-            s_file = winner_item.get('sound_file', "")
-            if s_file:
-                path = external_path(os.path.join("SOUND", s_file))
-                if os.path.exists(path):
-                    custom_sound_path = path
+            sound_file = winner_item.get('sound_file', "")
 
-        self.play_finish_sound(custom_sound_path)
+        self.play_finish_sound(sound_file)
         self.result_timer.start()
 
     def spin(self):
         """開始旋轉（標準速度）"""
         self.start_spin()
 
-    def paintEvent(self, event):
-        """繪製轉盤"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        rect = self.rect()
-        w = min(rect.width(), rect.height())
-        wheel_rect = QRectF((rect.width() - w)/2, 0, w, w)
-        center = wheel_rect.center()
-        radius = w / 2 - 25
-        self.wheel_center = center
-        self.wheel_radius = radius
-        
-        if not self.items:
-            return
-        total_weight = sum(item['weight'] for item in self.items)
+    def draw_wheel(self, painter, center, radius):
+        """繪製扇形、分隔線、邊框與文字 (起始角度固定為 0，旋轉由圖層貼圖處理)"""
+        total_weight = self.sector_index.total_weight
         if total_weight <= 0:
             return
-
-        # Rotation Mode Check
-        if self.wheel_mode == "image":
-            # 圖片模式：轉盤起始角度固定為 0。
-            # 指針圖片旋轉。
-            start_angle = 0 # 固定背景
-        else:
-            # 經典模式：轉盤旋轉。
-            start_angle = self._rotation_angle
+        start_angle = 0
         
         if self.border_enabled:
             painter.setBrush(Qt.NoBrush)
             painter.setPen(QPen(self.border_color, 4))
             painter.drawEllipse(center, radius + 2, radius + 2)
 
-        separator_angles = []
+        # 細節層級 (LOD)：以裝置像素計算扇形外緣弧長
+        pie_rect = QRectF(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
+        px_per_degree = math.radians(1) * radius * painter.device().devicePixelRatioF()
+        merged = None # 合併中的細小扇形 [起始角度, 角度, 權重加總的 r, g, b]
+        has_merged = False
+        min_label_height = self.min_label_height(radius)
+
         for i, item in enumerate(self.items):
-            weight = item['weight']
+            weight = self.sector_index.weights[i]
+            if weight <= 0:
+                continue # 已移除 (抽中移除模式) 的選項不繪製
             span_angle = (weight / total_weight) * 360 if total_weight > 0 else 0
             
+            if span_angle * px_per_degree < self.LOD_SEPARATOR_PX:
+                # 太窄看不到分隔線與文字：連續的細小扇形合併為一塊，以平均色填滿
+                color = item['color']
+                if merged is None:
+                    merged = [start_angle, 0.0, 0.0, 0.0, 0.0]
+                merged[1] += span_angle
+                merged[2] += color.redF() * span_angle
+                merged[3] += color.greenF() * span_angle
+                merged[4] += color.blueF() * span_angle
+                if merged[1] * px_per_degree >= self.LOD_MERGE_PX:
+                    self.draw_merged_sector(painter, pie_rect, merged)
+                    merged = None
+                has_merged = True
+                start_angle += span_angle
+                continue
+            if merged is not None:
+                self.draw_merged_sector(painter, pie_rect, merged)
+                merged = None
+            
             painter.setBrush(QBrush(item['color']))
             if self.separator_enabled:
                 painter.setPen(QPen(self.border_color, 2))
             else:
                 painter.setPen(Qt.NoPen)
             
-            painter.drawPie(QRectF(center.x() - radius, center.y() - radius, radius * 2, radius * 2), 
-                            int(start_angle * 16), int(span_angle * 16))
+            painter.drawPie(pie_rect, int(start_angle * 16), int(span_angle * 16))
             
-            mid_angle = start_angle + span_angle / 2
-            painter.save()
-            painter.translate(center)
-            painter.rotate(-mid_angle)
-            
-            if item['color'].lightness() < 128:
-                painter.setPen(Qt.white)
-            else:
-                painter.setPen(Qt.black)
-            
-            raw_text = item['name']
-            text_len = len(raw_text)
-            
-            # Chord calculation (still useful for height constraint)
-            # Text moved outwards, so mid-radius increases
-            mid_radius = radius * 0.70 
-            available_chord = 2 * mid_radius * math.sin(math.radians(span_angle / 2))
-            
-            # Auto-scale font size based on angle (Scope)
-            # Chord length at roughly mid-text radius (0.55R approx)
-            mid_radius = radius * 0.55
-            available_chord = 2 * mid_radius * math.sin(math.radians(span_angle / 2))
-            
-            # Base size based on wheel radius
-            base_size = int(radius / 15)
-            
-            # Dynamic scaling based on scope (chord length)
-            # If chord is small, shrink the target base size
-            target_size = base_size
-            if available_chord < base_size * 3:
-                 target_size = int(available_chord / 1.5)
-            
-            # Logic Update:
-            # Avoid Double Shrinking for Long Text
-            
-            if text_len > 6:
-                if target_size < base_size:
-                    # Already shrunk by scope (narrow wedge)
-                    # Don't shrink further, or it becomes unreadable (User: "Too small")
-                    final_size = target_size
+            # 扇形寬度放不下一行文字時略過 (文字字型有下限，硬畫會與相鄰文字重疊成雜訊)；
+            # 比最小字型還窄的扇形不必排版
+            chord = 2 * radius * 0.55 * math.sin(math.radians(span_angle / 2))
+            layout = self.label_layout(item['name'], span_angle, radius) if chord >= min_label_height else None
+            if layout is not None and chord >= layout['line_height']:
+                mid_angle = start_angle + span_angle / 2
+                painter.save()
+                painter.translate(center)
+                painter.rotate(-mid_angle)
+                
+                if item['color'].lightness() < 128:
+                    painter.setPen(Qt.white)
                 else:
-                    # Wide wedge, but long text
-                    # Shrink slightly to fit length
-                    final_size = int(base_size * 0.8)
-            else:
-                final_size = target_size
-
-            # Ensure minimum size (User Request: 10)
-            font_size = max(10, final_size)
-            
-            # Constraint: Never expand beyond default base_size
-            # (User Request: "不額外擴大超過預設大小")
-            # This handles the case where max(10, ...) might inflate text on a tiny wheel
-            font_size = min(font_size, base_size)
-
-            try:
-                self.wheel_font.setPointSize(font_size)
-            except:
-                self.wheel_font.setPointSize(10)
-            painter.setFont(self.wheel_font)
-            
-            # Text Placement Logic:
-            # Outer Edge: 0.95R (User request)
-            # Inner Edge: 0.18R (Clear of 0.15R hub)
-            # Alignment: Right-aligned (Text sits at outer edge, grows inward)
-            
-            text_start = radius * 0.18
-            text_end = radius * 0.95
-            text_rect_width = text_end - text_start
-            
-            # Constraints:
-            # User Rule: If text length <= 6, MUST SHOW completely (allow overlap).
-            # If > 6, fully visible too (relaxed height).
-            
-            if text_len <= 6:
-                # Relaxed height for short text to ensure visibility
-                text_rect_height = radius * 0.5 # Give plenty of vertical space
-            else:
-                 # Relaxed for long text too, relying on proper width/font
-                 text_rect_height = max(radius * 0.35, available_chord * 0.9) 
-            
-            # Start at determined position
-            text_rect = QRectF(text_start, -text_rect_height/2, text_rect_width, text_rect_height)
-            
-            # Fixed wrapping limit
-            limit = 9
+                    painter.setPen(Qt.black)
                 
-            words = raw_text.split(' ')
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                if len(word) > limit:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = ""
+                painter.setFont(layout['font'])
+                for static_text, pos in zip(layout['static_texts'], layout['positions']):
+                    painter.drawStaticText(pos, static_text)
                     
-                    for k in range(0, len(word), limit):
-                        lines.append(word[k:k+limit])
-                    continue
-                
-                test_line = (current_line + " " + word).strip() if current_line else word
-                if len(test_line) <= limit:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-            
-            if current_line:
-                lines.append(current_line)
-            
-            # Manual drawing for tighter line spacing
-            fm = painter.fontMetrics()
-            # 0.85 factor to reduce spacing (tighter than default)
-            line_height = fm.height() * 0.85 
-            total_text_height = len(lines) * line_height
-            
-            # Ensure text_rect_height is enough for content
-            # We ignore available_chord constraint to prevent clipping (User Request)
-            text_rect_height = max(radius * 0.35, total_text_height * 1.2)
+                painter.restore()
             
-            # Update rect height if needed (though we defined it loosely above)
-            # Re-center Y based on actual height
-            text_rect.setHeight(text_rect_height)
-            text_rect.moveTop(-text_rect_height/2)
+            start_angle += span_angle
 
-            # Start Y to center the block vertically in the available text_rect
-            current_y = text_rect.center().y() - (total_text_height / 2)
+        if merged is not None:
+            self.draw_merged_sector(painter, pie_rect, merged)
+        if has_merged and self.separator_enabled:
+            # 合併區段沒有外框，補畫外圈 (與扇形外框相同的筆)
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(self.border_color, 2))
+            painter.drawEllipse(pie_rect)
+
+    def draw_merged_sector(self, painter, pie_rect, merged):
+        """繪製合併後的細小扇形 (不畫分隔線)"""
+        start, span, r, g, b = merged
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor.fromRgbF(min(1.0, r / span), min(1.0, g / span), min(1.0, b / span)))
+        painter.drawPie(pie_rect, int(start * 16), max(1, int(span * 16)))
+
+    def min_label_height(self, radius):
+        """build_label_layout 最小字型 (10，小轉盤時為 radius / 15) 的行高"""
+        font = QFont(self.wheel_font)
+        font.setPointSize(max(1, min(10, int(radius / 15))))
+        return QFontMetrics(font).height() * 0.85
+
+    def label_layout(self, name, span_angle, radius):
+        """取得文字排版 (以名稱、角度、半徑與字型為鍵快取)"""
+        key = (name, span_angle, radius, self.wheel_font.family(), self.wheel_font.bold())
+        layout = self.label_layout_cache.get(key)
+        if layout is None:
+            layout = self.build_label_layout(name, span_angle, radius)
+            self.label_layout_cache[key] = layout
+        self.label_layouts_in_use[key] = layout
+        return layout
+
+    def build_label_layout(self, raw_text, span_angle, radius):
+        """計算選項文字的換行、字型大小、行高與位置"""
+        text_len = len(raw_text)
+        
+        # Chord calculation (still useful for height constraint)
+        # Text moved outwards, so mid-radius increases
+        mid_radius = radius * 0.70 
+        available_chord = 2 * mid_radius * math.sin(math.radians(span_angle / 2))
+        
+        # Auto-scale font size based on angle (Scope)
+        # Chord length at roughly mid-text radius (0.55R approx)
+        mid_radius = radius * 0.55
+        available_chord = 2 * mid_radius * math.sin(math.radians(span_angle / 2))
+        
+        # Base size based on wheel radius
+        base_size = int(radius / 15)
+        
+        # Dynamic scaling based on scope (chord length)
+        # If chord is small, shrink the target base size
+        target_size = base_size
+        if available_chord < base_size * 3:
+             target_size = int(available_chord / 1.5)
+        
+        # Logic Update:
+        # Avoid Double Shrinking for Long Text
+        
+        if text_len > 6:
+            if target_size < base_size:
+                # Already shrunk by scope (narrow wedge)
+                # Don't shrink further, or it becomes unreadable (User: "Too small")
+                final_size = target_size
+            else:
+                # Wide wedge, but long text
+                # Shrink slightly to fit length
+                final_size = int(base_size * 0.8)
+        else:
+            final_size = target_size
+
+        # Ensure minimum size (User Request: 10)
+        font_size = max(10, final_size)
+        
+        # Constraint: Never expand beyond default base_size
+        # (User Request: "不額外擴大超過預設大小")
+        # This handles the case where max(10, ...) might inflate text on a tiny wheel
+        font_size = min(font_size, base_size)
+
+        font = QFont(self.wheel_font)
+        try:
+            font.setPointSize(font_size)
+        except:
+            font.setPointSize(10)
+        
+        # Text Placement Logic:
+        # Outer Edge: 0.95R (User request)
+        # Inner Edge: 0.18R (Clear of 0.15R hub)
+        # Alignment: Right-aligned (Text sits at outer edge, grows inward)
+        
+        text_start = radius * 0.18
+        text_end = radius * 0.95
+        text_rect_width = text_end - text_start
+        
+        # Constraints:
+        # User Rule: If text length <= 6, MUST SHOW completely (allow overlap).
+        # If > 6, fully visible too (relaxed height).
+        
+        if text_len <= 6:
+            # Relaxed height for short text to ensure visibility
+            text_rect_height = radius * 0.5 # Give plenty of vertical space
+        else:
+             # Relaxed for long text too, relying on proper width/font
+             text_rect_height = max(radius * 0.35, available_chord * 0.9) 
+        
+        # Start at determined position
+        text_rect = QRectF(text_start, -text_rect_height/2, text_rect_width, text_rect_height)
+        
+        # Fixed wrapping limit
+        limit = 9
             
-            for line in lines:
-                line_rect = QRectF(text_rect.x(), current_y, text_rect.width(), line_height)
-                # Revert to AlignRight (Extend Inwards)
-                painter.drawText(line_rect, Qt.AlignRight | Qt.AlignVCenter, line)
-                current_y += line_height
+        words = raw_text.split(' ')
+        lines = []
+        current_line = ""
+        
+        for word in words:
+            if len(word) > limit:
+                if current_line:
+                    lines.append(current_line)
+                    current_line = ""
                 
-            painter.restore()
+                for k in range(0, len(word), limit):
+                    lines.append(word[k:k+limit])
+                continue
             
-            start_angle += span_angle
-            separator_angles.append(start_angle % 360)
+            test_line = (current_line + " " + word).strip() if current_line else word
+            if len(test_line) <= limit:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line)
+                current_line = word
+        
+        if current_line:
+            lines.append(current_line)
+        
+        # Manual drawing for tighter line spacing
+        fm = QFontMetrics(font)
+        # 0.85 factor to reduce spacing (tighter than default)
+        line_height = fm.height() * 0.85 
+        total_text_height = len(lines) * line_height
+        
+        # Ensure text_rect_height is enough for content
+        # We ignore available_chord constraint to prevent clipping (User Request)
+        text_rect_height = max(radius * 0.35, total_text_height * 1.2)
+        
+        # Update rect height if needed (though we defined it loosely above)
+        # Re-center Y based on actual height
+        text_rect.setHeight(text_rect_height)
+        text_rect.moveTop(-text_rect_height/2)
+
+        # Start Y to center the block vertically in the available text_rect
+        current_y = text_rect.center().y() - (total_text_height / 2)
+        
+        # 每行預先建立 QStaticText，避免每次繪製都重新排版字形
+        static_texts = []
+        positions = []
+        for line in lines:
+            static_text = QStaticText(line)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(QTransform(), font)
+            size = static_text.size()
+            # Revert to AlignRight (Extend Inwards)
+            positions.append(QPointF(text_rect.right() - size.width(), current_y + (line_height - size.height()) / 2))
+            static_texts.append(static_text)
+            current_y += line_height
+
+        return {
+            'lines': lines,
+            'font': font,
+            'font_size': font_size,
+            'line_height': line_height,
+            'text_rect': text_rect,
+            'static_texts': static_texts,
+            'positions': positions,
+        }
+
+    def paintEvent(self, event):
+        """繪製轉盤"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = self.rect()
+        center, radius = self.wheel_geometry()
+        self.wheel_center = center
+        self.wheel_radius = radius
+        
+        if not self.items:
+            return
+        if self.sector_index.total_weight <= 0:
+            return
+
+        # Rotation Mode Check
+        if self.wheel_mode == "image":
+            # 圖片模式：轉盤起始角度固定為 0。
+            # 指針圖片旋轉。
+            start_angle = 0 # 固定背景
+        else:
+            # 經典模式：轉盤旋轉。
+            start_angle = self._rotation_angle
+        
+        self.draw_wheel_layer(painter, center, radius, start_angle)
 
         # 繪製圖片指針
 
@@ -696,11 +1084,20 @@ class WheelWindow(QWidget):
             # 圖片頂部是局部 -Y。旋轉(90) 順時針將 -Y 移動到 +X。
             painter.rotate(90)
             
-            # 繪製圖片置中
-            target_h = radius * 1.0 * getattr(self, 'pointer_scale', 1.0)
-            target_w = target_h * (self.pointer_pixmap.width() / self.pointer_pixmap.height())
+            # 繪製圖片置中 (使用預先縮放的快取，不必每幀從原圖重新取樣)
+            target_w, target_h = self.pointer_target_size(radius)
+            pointer = self.scaled_pointer(target_w, target_h)
             
-            painter.drawPixmap(QRectF(-target_w/2, -target_h/2, target_w, target_h), self.pointer_pixmap, self.pointer_pixmap.rect())
+            if self.POINTER_ROTATION_STEPS:
+                painter.restore()
+                painter.save()
+                painter.translate(center)
+                rotated = self.rotated_pointer(pointer, 90 - image_angle)
+                dpr = rotated.devicePixelRatio()
+                painter.drawPixmap(QPointF(-rotated.width() / dpr / 2, -rotated.height() / dpr / 2), rotated)
+            else:
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.drawPixmap(QPointF(-target_w/2, -target_h/2), pointer)
             
             painter.restore()
 
@@ -717,10 +1114,18 @@ class WheelWindow(QWidget):
                 painter.drawLine(0, 0, radius, 0)
                 painter.restore()
 
-        if self.edit_mode and len(self.items) > 1:
-            for i, angle in enumerate(separator_angles):
-                
-                rad = math.radians(angle)
+        if self.edit_mode and len(self.items) > 1 and radius > 0:
+            # 只取間距 10 px 以上的控制點 (重疊的略過)，每幀的工作量與圓周像素有關而非選項數量；
+            # 懸停/拖曳中的一律繪製
+            handles = self.sector_index.spaced_bounds(math.degrees(10 / radius))
+            for i in (self.hover_separator_index, self.drag_separator_index):
+                if i != -1 and i not in handles:
+                    handles.append(i)
+            bounds = self.sector_index.bounds
+            for i in handles:
+                if i >= len(bounds):
+                    continue
+                rad = math.radians((start_angle + bounds[i]) % 360)
                 hx = center.x() + radius * math.cos(rad)
                 hy = center.y() - radius * math.sin(rad)
                 painter.setPen(Qt.NoPen)
@@ -807,25 +1212,6 @@ class WheelWindow(QWidget):
             painter.setFont(font)
             painter.drawText(box_rect, Qt.AlignCenter, box_text)
 
-
-        if self.wheel_mode == "image":
-             curr_angle = (90 + self._rotation_angle + self.pointer_angle_offset) % 360
-        else:
-             curr_angle = (self.classic_pointer_angle - self._rotation_angle) % 360
-        
-        curr_winner = ""
-        c_iter = 0
-        tot_w = sum(i['weight'] for i in self.items)
-        if tot_w > 0:
-            for i in self.items:
-                sp = (i['weight']/tot_w)*360
-                if c_iter <= curr_angle < c_iter+sp:
-                    curr_winner = i['name']
-                    break
-                c_iter += sp
-        
-
-
         if not self.edit_mode and self.show_resize_grip:
             grip_radius = 10
             gx = rect.width() - 20
@@ -932,6 +1318,7 @@ class WheelWindow(QWidget):
         """滑鼠釋放事件"""
         if self.edit_mode:
             self.drag_separator_index = -1
+            self.commit_drag()
         else:
             self.old_pos = None
             self.is_dragging_window = False
@@ -941,38 +1328,53 @@ class WheelWindow(QWidget):
     def resizeEvent(self, event):
         """視窗大小改變事件"""
         print(f"Wheel Window Size: {self.width()} x {self.height()}")
+        _, radius = self.wheel_geometry()
+        if radius != self.wheel_layer_radius:
+            self.invalidate_wheel_layer()
         super().resizeEvent(event)
     
     def closeEvent(self, event):
         """視窗關閉事件"""
         # 確保關閉時停止所有音效
-        self.loop_player.stop()
-        self.finish_player.stop()
-        self.tick_effect.stop()
+        if self.mixer is not None:
+            self.mixer.close()
+        elif not self.render_only:
+            self.loop_player.stop()
+            self.finish_player.stop()
+            self.tick_effect.stop()
+        self.tick_scheduler.cancel()
+        if self.edit_mode:
+            self.commit_drag()
             
         self.window_closed.emit()
         super().closeEvent(event)
 
     def get_hover_separator_index(self, pos):
         """取得滑鼠懸停的分隔線索引"""
-        if not self.items:
+        if not self.items or self.sector_index.total_weight <= 0:
             return -1
-        total_weight = sum(item['weight'] for item in self.items)
-        start_angle = self._rotation_angle
         handle_radius = self.wheel_radius
         threshold = 20
         
-        for i, item in enumerate(self.items):
-            weight = item['weight']
-            span_angle = (weight / total_weight) * 360 if total_weight > 0 else 360
-            start_angle += span_angle
-            angle = start_angle % 360
-            rad = math.radians(angle)
+        # 先換算成半徑與角度，離圓周太遠就不必找分隔線
+        dx = pos.x() - self.wheel_center.x()
+        dy = self.wheel_center.y() - pos.y()
+        if abs(math.hypot(dx, dy) - handle_radius) >= threshold:
+            return -1
+        mouse_angle = math.degrees(math.atan2(dy, dx))
+        
+        # 二分搜尋後只檢查兩側最近的分隔線
+        best = -1
+        best_dist_sq = threshold**2
+        for i in self.sector_index.nearest_bounds(mouse_angle - self._rotation_angle):
+            rad = math.radians((self._rotation_angle + self.sector_index.bounds[i]) % 360)
             hx = self.wheel_center.x() + handle_radius * math.cos(rad)
             hy = self.wheel_center.y() - handle_radius * math.sin(rad)
-            if (pos.x() - hx)**2 + (pos.y() - hy)**2 < threshold**2:
-                return i
-        return -1
+            dist_sq = (pos.x() - hx)**2 + (pos.y() - hy)**2
+            if dist_sq < best_dist_sq:
+                best = i
+                best_dist_sq = dist_sq
+        return best
 
     def handle_drag(self, current_mouse_angle):
         """處理拖曳分隔線以調整權重"""
@@ -985,11 +1387,8 @@ class WheelWindow(QWidget):
             idx_next = (i + 1) % n
             item_current = self.items[idx_current]
             item_next = self.items[idx_next]
-            total_weight = sum(item['weight'] for item in self.items)
-            weight_before = 0
-            for k in range(idx_current):
-                weight_before += self.items[k]['weight']
-            angle_start_current_rel = (weight_before / total_weight) * 360
+            total_weight = self.sector_index.total_weight
+            angle_start_current_rel = self.sector_index.start_angle(idx_current)
             angle_start_current_abs = (self._rotation_angle + angle_start_current_rel) % 360
             # Special handling for the last (0-degree) separator
             if i == n - 1:
@@ -1025,6 +1424,8 @@ class WheelWindow(QWidget):
                 # 3. Update rotation angle!
                 # The boundary (Start of First) is now at mouse angle
                 self._rotation_angle = current_mouse_angle
+                # 所有扇形的起始角度都改變，重建累積值
+                self.sector_index.rebuild(self.items)
                 
             else:
                 diff = current_mouse_angle - angle_start_current_abs
@@ -1046,12 +1447,24 @@ class WheelWindow(QWidget):
                     return
                 item_current['weight'] = new_weight_current
                 item_next['weight'] = new_weight_next
+                self.sector_index.move_boundary(idx_current, new_weight_current)
                 
-            self.weights_changed.emit()
+            self.sampler = None
+            self.invalidate_wheel_layer()
+            self.drag_weights_dirty = True
+            if not self.drag_preview_timer.isActive():
+                self.drag_preview_timer.start()
             self.update()
         except Exception as e:
             print(f"Error handling drag: {e}")
 
+    def commit_drag(self):
+        """拖曳結束：一次送出最終權重"""
+        self.drag_preview_timer.stop()
+        if self.drag_weights_dirty:
+            self.drag_weights_dirty = False
+            self.weights_changed.emit()
+
     def keyPressEvent(self, event):
         """處理鍵盤事件"""
         if event.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier) and event.key() == Qt.Key_F12: